@@ -10,6 +10,7 @@ Core translation agent that orchestrates:
 
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import AsyncGenerator, Optional
 
 from claude_agent_sdk import (
@@ -33,6 +34,12 @@ from agent.prompts.translation_prompts import (
 from agent.prompts.domain_prompts import get_domain_prompt
 
 
+@lru_cache(maxsize=32)
+def _get_domain_system_prompt(domain: str) -> str:
+    """Build the system prompt for a domain once; the templates are static."""
+    return get_system_prompt(get_domain_prompt(domain))
+
+
 @dataclass
 class SDKStreamChunk:
     """A chunk of streamed translation output from SDK."""
@@ -156,8 +163,7 @@ class SDKTranslatorAgent:
                 title = fetch_result.title
 
         # Build prompts
-        domain_modifier = get_domain_prompt(domain)
-        system_prompt = get_system_prompt(domain_modifier)
+        system_prompt = _get_domain_system_prompt(domain)
         user_prompt = get_translation_prompt(
             content=content,
             title=title,
@@ -238,8 +244,7 @@ class SDKTranslatorAgent:
         Yields:
             SDKStreamChunk objects with translation progress.
         """
-        domain_modifier = get_domain_prompt(domain)
-        system_prompt = get_system_prompt(domain_modifier)
+        system_prompt = _get_domain_system_prompt(domain)
         user_prompt = get_chunk_translation_prompt(
             content=content,
             chunk_number=chunk_number,
@@ -313,8 +318,7 @@ class SDKTranslatorAgent:
         Yields:
             SDKStreamChunk objects with progress and results.
         """
-        domain_modifier = get_domain_prompt(domain)
-        system_prompt = get_system_prompt(domain_modifier)
+        system_prompt = _get_domain_system_prompt(domain)
 
         # Include tools for autonomous operation
         options = self._create_agent_options(
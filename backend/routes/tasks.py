@@ -5,17 +5,22 @@ Provides:
 - POST /api/translate/background - Submit background translation task
 - GET /api/tasks - List tasks with pagination
 - GET /api/tasks/{task_id} - Get task details with result
+- GET /api/tasks/{task_id}/result - Download translation result as text
 - DELETE /api/tasks/{task_id} - Delete a task
 - POST /api/tasks/{task_id}/retry - Retry a failed task
 """
 
 import logging
 from datetime import datetime
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, request, jsonify, send_file
 
 from backend.middleware.auth import require_access_key
 from backend.services.cache_service import get_cache_service, TaskStatus
-from backend.services.task_manager import get_task_manager
+from backend.services.task_manager import (
+    BackgroundTaskManager,
+    QueueFullError,
+    get_task_manager,
+)
 from backend.services.task_persistence import get_persistence_service
 
 logger = logging.getLogger(__name__)
@@ -34,6 +39,16 @@ def error_response(code: str, message: str) -> dict:
     }
 
 
+def queue_full_response(e: QueueFullError):
+    """Create a 503 response asking the client to retry later."""
+    response = jsonify(error_response(
+        code='QUEUE_FULL',
+        message=str(e),
+    ))
+    response.headers['Retry-After'] = str(BackgroundTaskManager.QUEUE_FULL_RETRY_AFTER)
+    return response, 503
+
+
 def success_response(data: dict) -> dict:
     """Create standard success response."""
     return {
@@ -50,6 +65,7 @@ def submit_background_task():
 
     This API returns immediately after creating the task.
     URL fetching and content chunking are done in the background.
+    Returns 503 with a Retry-After header when the task queue is full.
 
     Request body:
     {
@@ -134,6 +150,9 @@ def submit_background_task():
             "sync_to_notion": sync_to_notion,
         })), 201
 
+    except QueueFullError as e:
+        return queue_full_response(e)
+
     except Exception as e:
         logger.error(f"Failed to submit background task: {e}", exc_info=True)
         return jsonify(error_response(
@@ -281,6 +300,71 @@ def get_task_detail(task_id: str):
         )), 500
 
 
+@tasks_bp.route('/api/tasks/<task_id>/result', methods=['GET'])
+@require_access_key
+def get_task_result(task_id: str):
+    """
+    Download the translation result of a completed task as plain text.
+
+    The result file is streamed from disk without loading it into
+    memory; falls back to the in-memory result if no file exists.
+
+    Path params:
+    - task_id: The task ID (must be in completed status)
+
+    Response: text/plain body with the translated content
+    """
+    try:
+        cache = get_cache_service()
+        persistence = get_persistence_service()
+
+        task = cache.get_task(task_id)
+        if not task:
+            return jsonify(error_response(
+                code='NOT_FOUND',
+                message=f'Task {task_id} not found',
+            )), 404
+
+        if task.status != TaskStatus.COMPLETED:
+            return jsonify(error_response(
+                code='INVALID_REQUEST',
+                message=f'Task is not completed. Current status: {task.status.value}',
+            )), 400
+
+        result_file = persistence.result_path(task_id)
+        if result_file is not None:
+            if result_file.suffix != '.gz':
+                return send_file(
+                    result_file.resolve(),
+                    mimetype='text/plain; charset=utf-8',
+                )
+
+            # Compressed on disk: send as-is when the client accepts gzip,
+            # otherwise decompress while streaming
+            if 'gzip' in request.accept_encodings:
+                response = send_file(
+                    result_file.resolve(),
+                    mimetype='text/plain; charset=utf-8',
+                )
+                response.headers['Content-Encoding'] = 'gzip'
+            else:
+                response = Response(
+                    persistence.iter_result(task_id),
+                    mimetype='text/plain; charset=utf-8',
+                )
+            response.vary.add('Accept-Encoding')
+            return response
+
+        return Response(task.partial_result, mimetype='text/plain; charset=utf-8')
+
+    except Exception as e:
+        logger.error(f"Failed to get task result: {e}", exc_info=True)
+        return jsonify(error_response(
+            code='INTERNAL_ERROR',
+            message=str(e),
+        )), 500
+
+
 @tasks_bp.route('/api/tasks/<task_id>', methods=['DELETE'])
 @require_access_key
 def delete_task(task_id: str):
@@ -385,6 +469,9 @@ def retry_task(task_id: str):
             "status": "pending",
         })), 200
 
+    except QueueFullError as e:
+        return queue_full_response(e)
+
     except Exception as e:
         logger.error(f"Failed to retry task: {e}", exc_info=True)
         return jsonify(error_response(
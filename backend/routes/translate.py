@@ -125,6 +125,7 @@ def translate_stream():
     - event: chunk_start - {"chunk_number": N, "total_chunks": M, "progress": P}
     - event: text - {"text": "...", "is_complete": false}
     - event: chunk_complete - {"chunk_number": N, "total_chunks": M, "progress": P}
+      (chunk_start/chunk_complete are skipped when P has not changed)
     - event: complete - {"text": "", "is_complete": true, ...}
     - event: error - {"text": "error message", "is_complete": true}
     """
@@ -156,8 +157,8 @@ def translate_stream():
                 sync_to_notion=req.sync_to_notion,
             )
             timeout = service.config.agent.timeout
-            for sse_string in _run_async_generator_sync(async_gen, timeout=timeout):
-                yield sse_string
+            for sse_frame in _run_async_generator_sync(async_gen, timeout=timeout):
+                yield sse_frame
 
         return Response(
             stream_with_context(generate()),
@@ -222,8 +223,8 @@ def translate_agent():
                 domain=domain,
             )
             timeout = service.config.agent.timeout
-            for sse_string in _run_async_generator_sync(async_gen, timeout=timeout):
-                yield sse_string
+            for sse_frame in _run_async_generator_sync(async_gen, timeout=timeout):
+                yield sse_frame
 
         return Response(
             stream_with_context(generate()),
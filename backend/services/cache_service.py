@@ -5,11 +5,14 @@ Provides task state management for long-running translations,
 enabling resume from the last successful chunk.
 """
 
+import os
 import threading
-import uuid
+from collections import Counter
+from operator import attrgetter
+from types import MappingProxyType
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Mapping, Optional, TypedDict
 from enum import Enum
 
 
@@ -22,7 +25,11 @@ class TaskStatus(str, Enum):
     FAILED = "failed"
 
 
-@dataclass
+# Sort key for ordering tasks by creation time
+_CREATED_AT = attrgetter("created_at")
+
+
+@dataclass(slots=True)
 class TranslationTask:
     """
     A translation task with state for checkpoint/resume.
@@ -67,6 +74,37 @@ class TranslationTask:
         return "\n\n".join(self.translated_chunks)
 
 
+class ProgressInfo(TypedDict, total=False):
+    """Progress information returned by CacheService.get_progress()."""
+    task_id: str
+    status: str
+    progress: int
+    partial_result: Optional[str]
+    original_content: str
+    title: Optional[str]
+    source_url: Optional[str]
+    domain: str
+    error: Optional[str]
+    chunks_completed: int
+    chunks_total: int
+    total_input_tokens: int
+    total_output_tokens: int
+
+
+class TaskMetadata(TypedDict):
+    """Task metadata returned by CacheService.get_task_metadata()."""
+    task_id: str
+    title: str
+    status: str
+    progress: int
+    domain: str
+    created_at: str
+    updated_at: str
+    error_message: Optional[str]
+    total_chunks: int
+    completed_chunks: int
+
+
 class CacheService:
     """
     In-memory cache service for translation tasks.
@@ -94,6 +132,13 @@ class CacheService:
         self._lock = threading.Lock()
         self._ttl = timedelta(minutes=ttl_minutes)
         self._max_entries = max_entries
+        # Bumped on every mutation; lets readers detect changes cheaply
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """Monotonic counter incremented whenever any task changes."""
+        return self._version
 
     def create_task(
         self,
@@ -116,7 +161,7 @@ class CacheService:
         Returns:
             Task ID for the new task.
         """
-        task_id = str(uuid.uuid4())
+        task_id = os.urandom(16).hex()
         task = TranslationTask(
             task_id=task_id,
             original_content=original_content,
@@ -131,6 +176,7 @@ class CacheService:
             self._cleanup_expired()
             self._ensure_capacity()
             self._cache[task_id] = task
+            self._version += 1
 
         return task_id
 
@@ -173,6 +219,7 @@ class CacheService:
             self._cleanup_expired()
             self._ensure_capacity()
             self._cache[task_id] = task
+            self._version += 1
 
         return task_id
 
@@ -190,6 +237,7 @@ class CacheService:
             task = self._cache.get(task_id)
             if task and self._is_expired(task):
                 del self._cache[task_id]
+                self._version += 1
                 return None
             return task
 
@@ -222,6 +270,47 @@ class CacheService:
             task.total_input_tokens += input_tokens
             task.total_output_tokens += output_tokens
             task.updated_at = datetime.now()
+            self._version += 1
+
+            # Check if complete
+            if task.is_complete:
+                task.status = TaskStatus.COMPLETED
+
+            return True
+
+    def update_progress_batch(
+        self,
+        task_id: str,
+        translated_chunks: List[str],
+        input_tokens: int = 0,
+        output_tokens: int = 0,
+    ) -> bool:
+        """
+        Update task with several newly translated chunks at once.
+
+        Equivalent to calling update_progress() for each chunk, but
+        acquires the lock only once for the whole batch.
+
+        Args:
+            task_id: The task ID.
+            translated_chunks: The translated chunk texts, in order.
+            input_tokens: Tokens used for input (whole batch).
+            output_tokens: Tokens generated for output (whole batch).
+
+        Returns:
+            True if update was successful, False if task not found.
+        """
+        with self._lock:
+            task = self._cache.get(task_id)
+            if not task:
+                return False
+
+            task.translated_chunks.extend(translated_chunks)
+            task.current_chunk = len(task.translated_chunks)
+            task.total_input_tokens += input_tokens
+            task.total_output_tokens += output_tokens
+            task.updated_at = datetime.now()
+            self._version += 1
 
             # Check if complete
             if task.is_complete:
@@ -246,6 +335,7 @@ class CacheService:
 
             task.status = TaskStatus.COMPLETED
             task.updated_at = datetime.now()
+            self._version += 1
             return True
 
     def mark_failed(self, task_id: str, error: str) -> bool:
@@ -267,9 +357,10 @@ class CacheService:
             task.status = TaskStatus.FAILED
             task.error = error
             task.updated_at = datetime.now()
+            self._version += 1
             return True
 
-    def get_progress(self, task_id: str) -> dict:
+    def get_progress(self, task_id: str) -> ProgressInfo:
         """
         Get task progress information.
 
@@ -333,6 +424,7 @@ class CacheService:
         with self._lock:
             if task_id in self._cache:
                 del self._cache[task_id]
+                self._version += 1
                 return True
             return False
 
@@ -346,6 +438,7 @@ class CacheService:
         with self._lock:
             count = len(self._cache)
             self._cache.clear()
+            self._version += 1
             return count
 
     def get_stats(self) -> dict:
@@ -357,10 +450,9 @@ class CacheService:
         """
         with self._lock:
             total = len(self._cache)
-            by_status = {}
-            for task in self._cache.values():
-                status = task.status.value
-                by_status[status] = by_status.get(status, 0) + 1
+            by_status = dict(Counter(
+                task.status.value for task in self._cache.values()
+            ))
 
             return {
                 "total_tasks": total,
@@ -403,15 +495,12 @@ class CacheService:
             return
 
         # Sort by created_at and remove oldest
-        sorted_tasks = sorted(
-            self._cache.items(),
-            key=lambda x: x[1].created_at,
-        )
+        sorted_tasks = sorted(self._cache.values(), key=_CREATED_AT)
 
         # Remove oldest 10% of tasks
         to_remove = max(1, len(sorted_tasks) // 10)
-        for task_id, _ in sorted_tasks[:to_remove]:
-            del self._cache[task_id]
+        for task in sorted_tasks[:to_remove]:
+            del self._cache[task.task_id]
 
     # ============================================================
     # Extended methods for background task support
@@ -429,6 +518,20 @@ class CacheService:
         with self._lock:
             return dict(self._cache)
 
+    def snapshot(self) -> Mapping[str, TranslationTask]:
+        """
+        Get a read-only point-in-time view of all tasks.
+
+        The lock is held only for a shallow copy of the index; callers
+        can iterate the returned mapping without blocking writers.
+
+        Returns:
+            Read-only mapping of task_id -> TranslationTask
+        """
+        with self._lock:
+            snap = self._cache.copy()
+        return MappingProxyType(snap)
+
     def restore_tasks(self, tasks: Dict[str, TranslationTask]) -> int:
         """
         Restore tasks from external source (persistence).
@@ -447,9 +550,10 @@ class CacheService:
                 if task_id not in self._cache:
                     self._cache[task_id] = task
                     restored += 1
+                    self._version += 1
             return restored
 
-    def get_task_metadata(self, task_id: str) -> Optional[dict]:
+    def get_task_metadata(self, task_id: str) -> Optional[TaskMetadata]:
         """
         Get task metadata without translation result.
 
@@ -512,7 +616,7 @@ class CacheService:
                 tasks = [t for t in tasks if t.status == status_filter]
 
             # Sort by created_at descending (newest first)
-            tasks.sort(key=lambda t: t.created_at, reverse=True)
+            tasks.sort(key=_CREATED_AT, reverse=True)
 
             total = len(tasks)
 
@@ -566,6 +670,7 @@ class CacheService:
             old_status = task.status
             task.status = status
             task.updated_at = datetime.now()
+            self._version += 1
 
             if error:
                 task.error = error
@@ -573,6 +678,32 @@ class CacheService:
             # Note: Status change notification handled by persistence service
             return True
 
+    def reset_for_retry(self, task_id: str) -> bool:
+        """
+        Reset a FAILED task to PENDING so it can be executed again.
+
+        Clears the error and any translated chunks under the lock, so the
+        change is picked up by the next persistence snapshot.
+
+        Args:
+            task_id: The task ID
+
+        Returns:
+            True if reset, False if task not found or not FAILED
+        """
+        with self._lock:
+            task = self._cache.get(task_id)
+            if not task or task.status != TaskStatus.FAILED:
+                return False
+
+            task.status = TaskStatus.PENDING
+            task.error = None
+            task.translated_chunks = []
+            task.current_chunk = 0
+            task.updated_at = datetime.now()
+            self._version += 1
+            return True
+
     def create_task_pending(
         self,
         task_id: str,
@@ -614,6 +745,7 @@ class CacheService:
             self._cleanup_expired()
             self._ensure_capacity()
             self._cache[task_id] = task
+            self._version += 1
 
         return task_id
 
@@ -623,7 +755,7 @@ class CacheService:
         original_content: str,
         chunks: List[str],
         title: Optional[str] = None,
-    ) -> bool:
+    ) -> Optional[TranslationTask]:
         """
         Update a task after preparation is complete.
 
@@ -636,12 +768,12 @@ class CacheService:
             title: Optional title (from URL fetch)
 
         Returns:
-            True if updated, False if task not found
+            The updated task, or None if task not found
         """
         with self._lock:
             task = self._cache.get(task_id)
             if not task:
-                return False
+                return None
 
             task.original_content = original_content
             task.chunks = chunks
@@ -649,7 +781,8 @@ class CacheService:
                 task.title = title
             task.status = TaskStatus.IN_PROGRESS
             task.updated_at = datetime.now()
-            return True
+            self._version += 1
+            return task
 
     def get_task_result(self, task_id: str) -> Optional[str]:
         """
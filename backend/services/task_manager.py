@@ -3,21 +3,26 @@ Background task manager for async translation processing.
 
 Provides:
 - Thread-safe task queue management
-- Single worker thread for serial execution
+- Pool of worker coroutines on a shared asyncio event loop
 - Retry mechanism with exponential backoff
 - Graceful shutdown support
 """
 
 import logging
-import queue
+import random
 import threading
 import time
-import uuid
+import secrets
 import asyncio
+import concurrent.futures
+import hashlib
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional, Callable, Any
 
+from agent.sdk_translator_agent import SDKTranslatorAgent
+from agent.tools.web_fetcher import WebFetcher
 from config.settings import AppConfig, get_config
 from backend.services.cache_service import (
     CacheService,
@@ -25,10 +30,15 @@ from backend.services.cache_service import (
     TaskStatus,
     TranslationTask,
 )
+from backend.services.chunking_service import ChunkingService
 
 logger = logging.getLogger(__name__)
 
 
+class QueueFullError(RuntimeError):
+    """Raised when a task is submitted while the task queue is full."""
+
+
 @dataclass
 class BackgroundTask:
     """
@@ -67,19 +77,39 @@ class BackgroundTaskManager:
     Manages background translation tasks.
 
     Features:
-    - Thread-safe task queue (unlimited capacity)
-    - Single worker thread for serial execution
-    - Retry mechanism with exponential backoff
+    - Thread-safe bounded task queue; submitting to a full queue raises
+      QueueFullError so callers can shed load
+    - Pool of worker coroutines; chunks of a task translated with bounded concurrency
+    - Retry mechanism with jittered exponential backoff
     - Integration with CacheService for state management
     - Graceful shutdown
 
     Configuration:
     - MAX_RETRY_COUNT: Maximum retry attempts per chunk (3)
+    - MAX_QUEUE_SIZE: Maximum queued (not yet running) tasks (1000)
+    - QUEUE_FULL_RETRY_AFTER: Seconds clients are told to wait when full (30)
+    - FAST_LANE_THRESHOLD / FAST_LANE_WEIGHT: Tasks under 4096 chars (or URL
+      tasks, whose length is unknown) use a fast lane; workers take 2 fast
+      tasks for every slow one so short tasks are not stuck behind long ones
+    - IO_THREADS: Threads for blocking steps (fetch, chunking, Notion sync) (32)
+    - MAX_RETRY_DELAY: Upper bound of the backoff window in seconds (30)
+    - PROGRESS_BATCH_SIZE / PROGRESS_FLUSH_INTERVAL: Translated chunks are
+      written to the cache every 4 chunks or 0.5 seconds, whichever first
     - CHUNK_TIMEOUT_SECONDS: Timeout for each chunk translation (from config.agent.timeout)
+    - worker_count: Tasks processed in parallel (from config.agent.worker_count)
+    - chunk_concurrency: Chunks of one task in flight at once (from config.agent.chunk_concurrency)
     """
 
     # Configuration constants
     MAX_RETRY_COUNT = 3
+    MAX_RETRY_DELAY = 30.0
+    PROGRESS_BATCH_SIZE = 4
+    PROGRESS_FLUSH_INTERVAL = 0.5
+    MAX_QUEUE_SIZE = 1000
+    QUEUE_FULL_RETRY_AFTER = 30
+    FAST_LANE_THRESHOLD = 4096
+    FAST_LANE_WEIGHT = 2
+    IO_THREADS = 32
 
     def __init__(
         self,
@@ -103,18 +133,50 @@ class BackgroundTaskManager:
 
         # Get timeout from configuration
         self.CHUNK_TIMEOUT_SECONDS = self._config.agent.timeout
-
-        # Task queue (thread-safe, unlimited capacity)
-        self._task_queue: queue.Queue[BackgroundTask] = queue.Queue()
-
-        # Pending task IDs for cancellation support
-        self._pending_tasks: set[str] = set()
-        self._pending_lock = threading.Lock()
-
-        # Worker thread
-        self._worker: Optional[threading.Thread] = None
+        self._worker_count = max(1, self._config.agent.worker_count)
+        self._chunk_concurrency = max(1, self._config.agent.chunk_concurrency)
+
+        # Helpers built once instead of per task/chunk. ChunkingService is
+        # thread-safe; WebFetcher holds a stateful HTML converter, so each
+        # fetch thread gets its own. The translator agent requires an API
+        # key, so it is created on first use.
+        self._chunker = ChunkingService(
+            max_tokens=self._config.translation.chunking.max_chunk_tokens,
+            overlap_sentences=self._config.translation.chunking.overlap_sentences,
+        )
+        self._fetchers = threading.local()
+        self._translator_agent: Optional[SDKTranslatorAgent] = None
+
+        # Task queues: a fast lane for short tasks and a slow lane for long
+        # ones (bounded together by MAX_QUEUE_SIZE at submit time, so memory
+        # held by waiting tasks stays bounded). deque append/popleft are atomic,
+        # so submitters never contend on a queue lock; _task_ready wakes
+        # the workers when something is appended or on shutdown. It is an
+        # asyncio.Event created in start() and only set on the event loop.
+        self._fast_queue: deque[BackgroundTask] = deque()
+        self._slow_queue: deque[BackgroundTask] = deque()
+        self._fast_streak = 0  # Fast tasks taken since the last slow one
+        self._task_ready: Optional[asyncio.Event] = None
+
+        # Pending task IDs for cancellation support, mapped to their dedup
+        # key ("" if none). Single dict operations are atomic, so pop()
+        # decides whether the worker or cancel_task() claims a task without
+        # a separate lock.
+        self._pending_tasks: dict[str, str] = {}
+
+        # Dedup key -> ID of the queued or running task that owns it, so an
+        # identical submission joins that task instead of translating twice
+        self._inflight_by_hash: dict[str, str] = {}
+
+        # Worker coroutines (futures of their run on the event loop)
+        self._workers: list[concurrent.futures.Future] = []
+
+        # Fire-and-forget jobs (Notion sync) still running on the loop;
+        # referenced here so they are not garbage-collected mid-flight
+        self._background_jobs: set[asyncio.Task] = set()
         self._running = False
-        self._shutdown_event = threading.Event()
+        # Set on the event loop at shutdown; cuts retry backoff short
+        self._shutdown_event: Optional[asyncio.Event] = None
 
         # Async event loop for translation execution
         self._loop: Optional[asyncio.AbstractEventLoop] = None
@@ -127,28 +189,47 @@ class BackgroundTaskManager:
             return
 
         self._running = True
-        self._shutdown_event.clear()
 
         # Start async event loop in separate thread
         self._start_event_loop()
+        self._task_ready = asyncio.Event()
+        self._shutdown_event = asyncio.Event()
+
+        # Start workers as coroutines on the event loop, so each chunk is
+        # awaited directly instead of handed across threads. They all pop
+        # from the shared deque, so idle workers pick up new tasks without
+        # a dispatcher.
+        self._workers = [
+            asyncio.run_coroutine_threadsafe(self._worker_loop(), self._loop)
+            for _ in range(self._worker_count)
+        ]
 
-        # Start worker thread
-        self._worker = threading.Thread(
-            target=self._worker_loop,
-            name="BackgroundTaskWorker",
-            daemon=True,
+        logger.info(
+            f"BackgroundTaskManager started with {self._worker_count} workers"
         )
-        self._worker.start()
-
-        logger.info("BackgroundTaskManager started")
 
     def _start_event_loop(self) -> None:
         """Start the async event loop in a separate thread."""
+        loop_ready = threading.Event()
+
         def run_loop():
             self._loop = asyncio.new_event_loop()
             asyncio.set_event_loop(self._loop)
+            # asyncio.to_thread() runs blocking steps on this pool; sized
+            # for I/O waits rather than the CPU-based stdlib default
+            self._loop.set_default_executor(
+                concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.IO_THREADS,
+                    thread_name_prefix="BackgroundTaskIO",
+                )
+            )
+            loop_ready.set()
             self._loop.run_forever()
 
+            # Stopped by shutdown(): release the pool's threads
+            self._loop.run_until_complete(self._loop.shutdown_default_executor())
+            self._loop.close()
+
         self._loop_thread = threading.Thread(
             target=run_loop,
             name="BackgroundTaskEventLoop",
@@ -157,8 +238,7 @@ class BackgroundTaskManager:
         self._loop_thread.start()
 
         # Wait for loop to be ready
-        while self._loop is None:
-            time.sleep(0.01)
+        loop_ready.wait()
 
     def submit_task(
         self,
@@ -185,11 +265,30 @@ class BackgroundTaskManager:
 
         Raises:
             RuntimeError: If manager is not running
+            QueueFullError: If the task queue is full
         """
         if not self._running:
             raise RuntimeError("BackgroundTaskManager is not running")
+        self._check_queue_capacity()
 
-        task_id = str(uuid.uuid4())
+        task_id = secrets.token_hex(16)
+
+        # Create the cache entry before the dedup key is published, so an
+        # identical submission that joins this task can already look it up
+        self._cache.create_task_pending(
+            task_id=task_id,
+            original_content=content,
+            title=title,
+            source_url=source_url,
+            domain=domain,
+        )
+
+        dedup_key = self._dedup_key(
+            content, "", title, source_url, domain, source_lang, target_lang, False
+        )
+        existing_id = self._claim_inflight(dedup_key, task_id)
+        if existing_id:
+            return existing_id
 
         # Create background task
         task = BackgroundTask(
@@ -202,12 +301,7 @@ class BackgroundTaskManager:
             target_lang=target_lang,
         )
 
-        # Add to pending set for cancellation support
-        with self._pending_lock:
-            self._pending_tasks.add(task_id)
-
-        # Add to queue
-        self._task_queue.put(task)
+        self._enqueue(task, dedup_key)
 
         logger.info(
             f"Task submitted: {task_id}, "
@@ -244,12 +338,21 @@ class BackgroundTaskManager:
 
         Returns:
             Task ID
+
+        Raises:
+            RuntimeError: If manager is not running
+            QueueFullError: If the task queue is full
         """
         if not self._running:
             raise RuntimeError("BackgroundTaskManager is not running")
+        self._check_queue_capacity()
+
+        task_id = secrets.token_hex(16)
 
-        # Create task in cache first (pending status)
-        task_id = self._cache.create_task(
+        # Create task in cache first (pending status), before the dedup key
+        # is published
+        self._cache.create_task_with_id(
+            task_id=task_id,
             original_content=content,
             chunks=chunks,
             title=title,
@@ -257,10 +360,15 @@ class BackgroundTaskManager:
             domain=domain,
         )
 
-        # Update status to pending (create_task sets IN_PROGRESS by default)
-        task = self._cache.get_task(task_id)
-        if task:
-            task.status = TaskStatus.PENDING
+        # Update status to pending (create_task_with_id sets IN_PROGRESS by default)
+        self._cache.set_task_status(task_id, TaskStatus.PENDING)
+
+        dedup_key = self._dedup_key(
+            content, "", title, source_url, domain, source_lang, target_lang, False
+        )
+        existing_id = self._claim_inflight(dedup_key, task_id)
+        if existing_id:
+            return existing_id
 
         # Create background task
         bg_task = BackgroundTask(
@@ -273,12 +381,7 @@ class BackgroundTaskManager:
             target_lang=target_lang,
         )
 
-        # Add to pending set
-        with self._pending_lock:
-            self._pending_tasks.add(task_id)
-
-        # Add to queue
-        self._task_queue.put(bg_task)
+        self._enqueue(bg_task, dedup_key)
 
         logger.info(
             f"Task submitted with cache: {task_id}, "
@@ -322,13 +425,16 @@ class BackgroundTaskManager:
 
         Raises:
             RuntimeError: If manager is not running
+            QueueFullError: If the task queue is full
         """
         if not self._running:
             raise RuntimeError("BackgroundTaskManager is not running")
+        self._check_queue_capacity()
 
-        task_id = str(uuid.uuid4())
+        task_id = secrets.token_hex(16)
 
-        # Create lightweight cache entry (PENDING status, no chunks)
+        # Create lightweight cache entry (PENDING status, no chunks) before
+        # the dedup key is published
         self._cache.create_task_pending(
             task_id=task_id,
             original_content=content,
@@ -338,6 +444,14 @@ class BackgroundTaskManager:
             domain=domain,
         )
 
+        dedup_key = self._dedup_key(
+            content, url, title, source_url, domain,
+            source_lang, target_lang, sync_to_notion,
+        )
+        existing_id = self._claim_inflight(dedup_key, task_id)
+        if existing_id:
+            return existing_id
+
         # Create background task
         bg_task = BackgroundTask(
             task_id=task_id,
@@ -351,12 +465,7 @@ class BackgroundTaskManager:
             sync_to_notion=sync_to_notion,
         )
 
-        # Add to pending set for cancellation support
-        with self._pending_lock:
-            self._pending_tasks.add(task_id)
-
-        # Add to queue
-        self._task_queue.put(bg_task)
+        self._enqueue(bg_task, dedup_key)
 
         logger.info(
             f"Task submitted fast: {task_id}, "
@@ -377,6 +486,9 @@ class BackgroundTaskManager:
 
         Returns:
             True if task was re-queued, False if task not found or not failed
+
+        Raises:
+            QueueFullError: If the task queue is full
         """
         task = self._cache.get_task(task_id)
         if not task:
@@ -390,12 +502,13 @@ class BackgroundTaskManager:
             )
             return False
 
-        # Reset task state for retry
-        task.status = TaskStatus.PENDING
-        task.error = None
-        task.translated_chunks = []
-        task.current_chunk = 0
-        task.updated_at = datetime.now()
+        self._check_queue_capacity()
+
+        # Reset task state for retry (through the cache, so the change is
+        # versioned and reaches the next snapshot)
+        if not self._cache.reset_for_retry(task_id):
+            logger.warning(f"Retry failed: task {task_id} changed state")
+            return False
 
         # Create background task for re-execution
         bg_task = BackgroundTask(
@@ -406,15 +519,120 @@ class BackgroundTaskManager:
             domain=task.domain,
         )
 
-        # Add to pending set and queue
-        with self._pending_lock:
-            self._pending_tasks.add(task_id)
-
-        self._task_queue.put(bg_task)
+        self._enqueue(bg_task)
 
         logger.info(f"Task re-queued for retry: {task_id}")
         return True
 
+    def _check_queue_capacity(self) -> None:
+        """
+        Refuse new work while MAX_QUEUE_SIZE tasks are already waiting.
+
+        Raises:
+            QueueFullError: If the task queue is full
+        """
+        if self.get_queue_size() >= self.MAX_QUEUE_SIZE:
+            logger.warning(
+                f"Task rejected: queue full ({self.MAX_QUEUE_SIZE} tasks waiting)"
+            )
+            raise QueueFullError(
+                f"Task queue is full ({self.MAX_QUEUE_SIZE} tasks waiting)"
+            )
+
+    @staticmethod
+    def _dedup_key(content: str, url: str, *options: Any) -> str:
+        """
+        Hash everything that determines a task's output.
+
+        Args:
+            content: Text content to translate
+            url: URL to fetch content from
+            *options: Remaining submit arguments (title, domain, languages...)
+
+        Returns:
+            Hex digest identifying identical submissions
+        """
+        # The length prefix keeps the metadata/content boundary unambiguous
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(repr((len(content), url) + options).encode("utf-8"))
+        digest.update(content.encode("utf-8", "surrogatepass"))
+        return digest.hexdigest()
+
+    def _claim_inflight(self, dedup_key: str, task_id: str) -> Optional[str]:
+        """
+        Register task_id as the owner of dedup_key.
+
+        The caller must already have created task_id's cache entry, so the
+        ID is never handed out before it can be looked up. If an identical
+        task is already in flight, that entry is deleted again.
+
+        Args:
+            dedup_key: Key from _dedup_key()
+            task_id: ID of the task about to be submitted
+
+        Returns:
+            ID of an identical task already in flight, or None if task_id
+            now owns the key
+        """
+        existing_id = self._inflight_by_hash.setdefault(dedup_key, task_id)
+        if existing_id != task_id:
+            self._cache.delete_task(task_id)
+            logger.info(f"Duplicate submission joined in-flight task {existing_id}")
+            return existing_id
+        return None
+
+    def _release_inflight(self, dedup_key: str, task_id: str) -> None:
+        """Drop dedup_key once its owning task has finished or been cancelled."""
+        if dedup_key and self._inflight_by_hash.get(dedup_key) == task_id:
+            self._inflight_by_hash.pop(dedup_key, None)
+
+    def _enqueue(self, task: BackgroundTask, dedup_key: str = "") -> None:
+        """
+        Add a task to the queue and wake the worker.
+
+        Args:
+            task: The background task to queue
+            dedup_key: Key the task owns in _inflight_by_hash, if any
+        """
+        # Register as pending for cancellation support
+        self._pending_tasks[task.task_id] = dedup_key
+
+        self._lane_for(task).append(task)
+        self._loop.call_soon_threadsafe(self._task_ready.set)
+
+    def _lane_for(self, task: BackgroundTask) -> deque[BackgroundTask]:
+        """Pick the queue for a task by its content length."""
+        if not task.content or len(task.content) < self.FAST_LANE_THRESHOLD:
+            return self._fast_queue
+        return self._slow_queue
+
+    def _pop_task(self) -> Optional[BackgroundTask]:
+        """
+        Take the next task, FAST_LANE_WEIGHT fast tasks per slow one.
+
+        Either lane is used alone when the other is empty. Only called on
+        the event loop thread, so _fast_streak needs no lock.
+
+        Returns:
+            The next task, or None if both queues are empty
+        """
+        if self._fast_streak >= self.FAST_LANE_WEIGHT:
+            lanes = (self._slow_queue, self._fast_queue)
+        else:
+            lanes = (self._fast_queue, self._slow_queue)
+
+        for lane in lanes:
+            try:
+                task = lane.popleft()
+            except IndexError:
+                continue
+            if lane is self._fast_queue:
+                self._fast_streak += 1
+            else:
+                self._fast_streak = 0
+            return task
+        return None
+
     def cancel_task(self, task_id: str) -> bool:
         """
         Cancel a pending task.
@@ -427,30 +645,30 @@ class BackgroundTaskManager:
         Returns:
             True if task was cancelled, False otherwise
         """
-        with self._pending_lock:
-            if task_id in self._pending_tasks:
-                self._pending_tasks.discard(task_id)
+        dedup_key = self._pending_tasks.pop(task_id, None)
+        if dedup_key is not None:
+            self._release_inflight(dedup_key, task_id)
 
-                # Update cache status
-                task = self._cache.get_task(task_id)
-                if task and task.status == TaskStatus.PENDING:
-                    self._cache.mark_failed(task_id, "Task cancelled by user")
-                    logger.info(f"Task cancelled: {task_id}")
-                    return True
+            # Update cache status
+            task = self._cache.get_task(task_id)
+            if task and task.status == TaskStatus.PENDING:
+                self._cache.mark_failed(task_id, "Task cancelled by user")
+                logger.info(f"Task cancelled: {task_id}")
+                return True
 
         logger.warning(f"Cannot cancel task {task_id}: not in pending state")
         return False
 
     def get_queue_size(self) -> int:
         """Get the current queue size."""
-        return self._task_queue.qsize()
+        return len(self._fast_queue) + len(self._slow_queue)
 
     def shutdown(self, wait: bool = True, timeout: float = 30.0) -> None:
         """
         Gracefully shutdown the task manager.
 
         Args:
-            wait: If True, wait for current task to complete
+            wait: If True, wait for running tasks to complete
             timeout: Maximum seconds to wait for shutdown
         """
         if not self._running:
@@ -459,10 +677,20 @@ class BackgroundTaskManager:
         logger.info("Shutting down BackgroundTaskManager...")
 
         self._running = False
-        self._shutdown_event.set()
+        self._loop.call_soon_threadsafe(self._shutdown_event.set)
+        self._loop.call_soon_threadsafe(self._task_ready.set)
 
-        if wait and self._worker and self._worker.is_alive():
-            self._worker.join(timeout=timeout)
+        if wait:
+            deadline = time.monotonic() + timeout
+            concurrent.futures.wait(self._workers, timeout=timeout)
+
+            # Let in-flight Notion syncs finish within the same deadline
+            pending_jobs = asyncio.run_coroutine_threadsafe(
+                self._wait_background_jobs(), self._loop
+            )
+            concurrent.futures.wait(
+                [pending_jobs], timeout=max(0.0, deadline - time.monotonic())
+            )
 
         # Stop event loop
         if self._loop and self._loop.is_running():
@@ -473,42 +701,63 @@ class BackgroundTaskManager:
 
         logger.info("BackgroundTaskManager shutdown complete")
 
-    def _worker_loop(self) -> None:
-        """Main worker loop - processes tasks serially."""
+    def _spawn_background(self, coro) -> None:
+        """
+        Run a coroutine on the event loop without waiting for it.
+
+        Must be called from the event loop thread.
+
+        Args:
+            coro: Coroutine to schedule
+        """
+        job = asyncio.create_task(coro)
+        self._background_jobs.add(job)
+        job.add_done_callback(self._background_jobs.discard)
+
+    async def _wait_background_jobs(self) -> None:
+        """Wait for all fire-and-forget jobs scheduled so far."""
+        if self._background_jobs:
+            await asyncio.wait(set(self._background_jobs))
+
+    async def _worker_loop(self) -> None:
+        """Main worker loop - processes tasks one at a time per worker."""
         logger.info("Worker loop started")
 
-        while self._running or not self._task_queue.empty():
+        while self._running or self.get_queue_size():
             try:
-                # Get task with timeout to allow shutdown check
-                try:
-                    task = self._task_queue.get(timeout=1.0)
-                except queue.Empty:
+                task = self._pop_task()
+                if task is None:
+                    # Block until a submit or shutdown sets the event. The
+                    # queues are re-checked after clear(), so a wake-up that
+                    # races with the clear is never lost.
+                    await self._task_ready.wait()
+                    self._task_ready.clear()
                     continue
 
                 # Check if shutdown was requested
-                if self._shutdown_event.is_set():
+                if not self._running:
                     # Re-queue the task for recovery after restart
-                    self._task_queue.put(task)
+                    self._lane_for(task).appendleft(task)
                     break
 
                 # Check if task was cancelled
-                with self._pending_lock:
-                    if task.task_id not in self._pending_tasks:
-                        logger.info(f"Task {task.task_id} was cancelled, skipping")
-                        self._task_queue.task_done()
-                        continue
-                    self._pending_tasks.discard(task.task_id)
+                dedup_key = self._pending_tasks.pop(task.task_id, None)
+                if dedup_key is None:
+                    logger.info(f"Task {task.task_id} was cancelled, skipping")
+                    continue
 
                 # Execute the task
-                self._execute_task(task)
-                self._task_queue.task_done()
+                try:
+                    await self._execute_task(task)
+                finally:
+                    self._release_inflight(dedup_key, task.task_id)
 
             except Exception as e:
                 logger.error(f"Error in worker loop: {e}", exc_info=True)
 
         logger.info("Worker loop stopped")
 
-    def _execute_task(self, task: BackgroundTask) -> None:
+    async def _execute_task(self, task: BackgroundTask) -> None:
         """
         Execute a single translation task.
 
@@ -516,6 +765,9 @@ class BackgroundTaskManager:
         1. PREPARING phase: URL fetch (if needed) + content chunking
         2. IN_PROGRESS phase: Translation of all chunks
 
+        Blocking steps (URL fetch, chunking, Notion sync) run in worker
+        threads so they never stall the event loop.
+
         Args:
             task: The background task to execute
         """
@@ -541,7 +793,9 @@ class BackgroundTaskManager:
             # Fetch URL content if needed
             if task.url and not content:
                 logger.info(f"Task {task_id}: Fetching URL: {task.url}")
-                fetch_result = self._fetch_url_content(task.url)
+                fetch_result = await asyncio.to_thread(
+                    self._fetch_url_content, task.url
+                )
                 if not fetch_result.success:
                     error_msg = f"URL 获取失败: {fetch_result.error}"
                     logger.error(f"Task {task_id}: {error_msg}")
@@ -560,19 +814,19 @@ class BackgroundTaskManager:
                 return
 
             # Split content into chunks
-            chunks = self._split_content_to_chunks(content)
+            chunks = await asyncio.to_thread(
+                self._split_content_to_chunks, content
+            )
             logger.info(f"Task {task_id}: Content split into {len(chunks)} chunks")
 
-            # Update cache with prepared content
-            self._cache.update_task_prepared(
+            # Update cache with prepared content; the updated task is
+            # passed on from here instead of being looked up again
+            cache_task = self._cache.update_task_prepared(
                 task_id=task_id,
                 original_content=content,
                 chunks=chunks,
                 title=title,
             )
-
-            # Refresh cache_task reference
-            cache_task = self._cache.get_task(task_id)
             if not cache_task:
                 logger.error(f"Failed to get updated cache task: {task_id}")
                 return
@@ -589,7 +843,7 @@ class BackgroundTaskManager:
         # Note: status is already set to IN_PROGRESS by update_task_prepared()
 
         try:
-            self._translate_chunks(
+            await self._translate_chunks(
                 task_id=task_id,
                 cache_task=cache_task,
                 domain=task.domain,
@@ -610,8 +864,9 @@ class BackgroundTaskManager:
         Returns:
             FetchResult object with success, content, title, and error fields
         """
-        from agent.tools.web_fetcher import WebFetcher
-        fetcher = WebFetcher()
+        fetcher = getattr(self._fetchers, "fetcher", None)
+        if fetcher is None:
+            fetcher = self._fetchers.fetcher = WebFetcher()
         return fetcher.fetch(url)
 
     def _split_content_to_chunks(self, content: str) -> list[str]:
@@ -624,21 +879,12 @@ class BackgroundTaskManager:
         Returns:
             List of content chunks
         """
-        from backend.services.chunking_service import ChunkingService
-        from config.settings import get_config
-
-        config = get_config()
-        chunking = ChunkingService(
-            max_tokens=config.translation.chunking.max_chunk_tokens,
-            overlap_sentences=config.translation.chunking.overlap_sentences,
-        )
-
-        if chunking.needs_chunking(content):
-            return chunking.split_by_semantic(content)
+        if self._chunker.needs_chunking(content):
+            return self._chunker.split_by_semantic(content)
         else:
             return [content]
 
-    def _translate_chunks(
+    async def _translate_chunks(
         self,
         task_id: str,
         cache_task: TranslationTask,
@@ -649,6 +895,12 @@ class BackgroundTaskManager:
         """
         Translate all chunks for a task.
 
+        Up to chunk_concurrency chunks are in flight at once. Each chunk
+        gets the tail of the previous chunk's translation as context if that
+        chunk has finished by the time it starts, which is always the case
+        with the default concurrency of 1. Results are committed to the
+        cache in chunk order, in batches (see PROGRESS_BATCH_SIZE).
+
         Args:
             task_id: Task identifier
             cache_task: Cache task object
@@ -658,57 +910,96 @@ class BackgroundTaskManager:
         """
         chunks = cache_task.chunks
         total_chunks = len(chunks)
-        context = ""
 
-        logger.info(f"Translating {total_chunks} chunks for task {task_id}")
+        # Already translated chunks (for resume) are always a prefix
+        done = len(cache_task.translated_chunks)
+        results: list[Optional[str]] = (
+            list(cache_task.translated_chunks) + [None] * (total_chunks - done)
+        )
+        next_ready = done  # End of the contiguous translated prefix
+        committed = done  # Chunks already written to the cache
+        last_flush = time.monotonic()
+        semaphore = asyncio.Semaphore(self._chunk_concurrency)
 
-        for i, chunk_text in enumerate(chunks):
-            # Check if already translated (for resume)
-            if i < len(cache_task.translated_chunks):
-                context = cache_task.translated_chunks[i][-500:] if cache_task.translated_chunks[i] else ""
-                continue
+        logger.info(f"Translating {total_chunks} chunks for task {task_id}")
 
-            # Translate chunk with retry
-            try:
-                translated = self._execute_chunk_with_retry(
-                    chunk_text=chunk_text,
-                    chunk_number=i + 1,
-                    total_chunks=total_chunks,
-                    context=context,
-                    domain=domain,
+        def flush_progress() -> None:
+            nonlocal committed, last_flush
+            if next_ready > committed:
+                self._cache.update_progress_batch(
                     task_id=task_id,
+                    translated_chunks=results[committed:next_ready],
                 )
+                committed = next_ready
+            last_flush = time.monotonic()
 
-                # Update progress
-                self._cache.update_progress(
-                    task_id=task_id,
-                    translated_chunk=translated,
-                )
+        async def translate_one(i: int) -> None:
+            nonlocal next_ready
+            async with semaphore:
+                previous = results[i - 1] if i else None
+                context = previous[-500:] if previous else ""
 
-                # Update context for next chunk
-                context = translated[-500:] if len(translated) > 500 else translated
+                # Translate chunk with retry
+                try:
+                    translated = await self._execute_chunk_with_retry(
+                        chunk_text=chunks[i],
+                        chunk_number=i + 1,
+                        total_chunks=total_chunks,
+                        context=context,
+                        domain=domain,
+                        task_id=task_id,
+                    )
+                except Exception as e:
+                    logger.error(
+                        f"Task {task_id}: chunk {i + 1}/{total_chunks} failed "
+                        f"after {self.MAX_RETRY_COUNT} retries: {e}"
+                    )
+                    raise RuntimeError(f"Chunk {i + 1} failed: {str(e)}") from e
 
-                logger.info(
-                    f"Task {task_id}: chunk {i + 1}/{total_chunks} completed"
-                )
+                # Recorded before releasing the semaphore, so the next chunk
+                # sees it as context when running one at a time
+                results[i] = translated
 
-            except Exception as e:
-                logger.error(
-                    f"Task {task_id}: chunk {i + 1}/{total_chunks} failed "
-                    f"after {self.MAX_RETRY_COUNT} retries: {e}"
-                )
-                self._cache.mark_failed(task_id, f"Chunk {i + 1} failed: {str(e)}")
-                return
+            logger.info(f"Task {task_id}: chunk {i + 1}/{total_chunks} completed")
+
+            # Update progress with the contiguous translated prefix
+            while next_ready < total_chunks and results[next_ready] is not None:
+                next_ready += 1
+            if (
+                next_ready - committed >= self.PROGRESS_BATCH_SIZE
+                or time.monotonic() - last_flush >= self.PROGRESS_FLUSH_INTERVAL
+            ):
+                flush_progress()
+
+        jobs = [
+            asyncio.create_task(translate_one(i))
+            for i in range(done, total_chunks)
+        ]
+        try:
+            await asyncio.gather(*jobs)
+        except Exception as e:
+            # Stop the remaining chunks; the task has already failed
+            for job in jobs:
+                job.cancel()
+            await asyncio.gather(*jobs, return_exceptions=True)
+            flush_progress()
+            self._cache.mark_failed(task_id, str(e))
+            return
+
+        flush_progress()
 
         # Mark task as completed
         self._cache.mark_completed(task_id)
         logger.info(f"Task {task_id} completed successfully")
 
-        # Sync to Notion if requested
+        # Sync to Notion if requested. Runs in the background so the worker
+        # can move on to the next task during the publish round-trip.
         if sync_to_notion:
-            self._sync_to_notion(task_id, title)
+            self._spawn_background(
+                asyncio.to_thread(self._sync_to_notion, cache_task, title)
+            )
 
-    def _execute_chunk_with_retry(
+    async def _execute_chunk_with_retry(
         self,
         chunk_text: str,
         chunk_number: int,
@@ -742,15 +1033,16 @@ class BackgroundTaskManager:
                 timeout = self.CHUNK_TIMEOUT_SECONDS
 
                 if self._translation_executor:
-                    # Use custom executor if provided
-                    return self._translation_executor(
+                    # Use custom executor if provided (synchronous callable)
+                    return await asyncio.to_thread(
+                        self._translation_executor,
                         chunk_text,
                         domain,
                         context,
                     )
                 else:
                     # Use SDK translator agent
-                    return self._execute_chunk_translation(
+                    return await self._execute_chunk_translation(
                         chunk_text=chunk_text,
                         chunk_number=chunk_number,
                         total_chunks=total_chunks,
@@ -760,20 +1052,21 @@ class BackgroundTaskManager:
 
             except Exception as e:
                 last_error = e
-                retry_delay = self._get_retry_delay(retry)
+                retry_delay = self._get_retry_delay(retry, e)
 
                 logger.warning(
                     f"Task {task_id}: chunk {chunk_number} failed "
                     f"(attempt {retry + 1}/{self.MAX_RETRY_COUNT}), "
-                    f"retrying in {retry_delay}s: {e}"
+                    f"retrying in {retry_delay:.1f}s: {e}"
                 )
 
                 if retry < self.MAX_RETRY_COUNT - 1:
-                    time.sleep(retry_delay)
+                    if await self._wait_for_shutdown(retry_delay):
+                        raise RuntimeError("Shutdown during retry") from e
 
         raise last_error or Exception("Translation failed after all retries")
 
-    def _execute_chunk_translation(
+    async def _execute_chunk_translation(
         self,
         chunk_text: str,
         chunk_number: int,
@@ -794,13 +1087,11 @@ class BackgroundTaskManager:
         Returns:
             Translated text
         """
-        from agent.sdk_translator_agent import SDKTranslatorAgent
-        from config.settings import get_config
-
-        config = get_config()
-        agent = SDKTranslatorAgent(config)
+        # Only touched on the event loop thread, so no lock is needed
+        if self._translator_agent is None:
+            self._translator_agent = SDKTranslatorAgent(self._config)
+        agent = self._translator_agent
 
-        # Run async translation in the event loop
         async def do_translate():
             result_parts = []
             async for chunk in agent.translate_chunk_stream(
@@ -814,47 +1105,79 @@ class BackgroundTaskManager:
                     result_parts.append(chunk.text)
             return "".join(result_parts)
 
-        # Execute in the async event loop with timeout
-        future = asyncio.run_coroutine_threadsafe(do_translate(), self._loop)
+        # Awaited directly on the worker's event loop, with timeout
         try:
-            return future.result(timeout=self.CHUNK_TIMEOUT_SECONDS)
+            return await asyncio.wait_for(
+                do_translate(), timeout=self.CHUNK_TIMEOUT_SECONDS
+            )
         except asyncio.TimeoutError:
-            future.cancel()
             raise TimeoutError(
                 f"Chunk translation timed out after {self.CHUNK_TIMEOUT_SECONDS}s"
             )
 
-    @staticmethod
-    def _get_retry_delay(retry_count: int) -> float:
+    async def _wait_for_shutdown(self, timeout: float) -> bool:
         """
-        Calculate retry delay using exponential backoff.
+        Sleep for up to timeout seconds, waking early on shutdown.
 
-        Formula: 2^retry_count seconds
-        - retry 0: 1 second
-        - retry 1: 2 seconds
-        - retry 2: 4 seconds
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if shutdown was requested, False if the timeout elapsed
+        """
+        try:
+            await asyncio.wait_for(self._shutdown_event.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    @classmethod
+    def _get_retry_delay(
+        cls, retry_count: int, error: Optional[BaseException] = None
+    ) -> float:
+        """
+        Calculate retry delay using exponential backoff with full jitter.
+
+        Formula: uniform(0, min(MAX_RETRY_DELAY, 2^retry_count)) seconds
+        - retry 0: up to 1 second
+        - retry 1: up to 2 seconds
+        - retry 2: up to 4 seconds
+
+        Random delays keep tasks that failed together (e.g. on a rate
+        limit) from retrying in lockstep. A retry_after hint carried by
+        the error, as rate-limit errors often do, takes precedence.
 
         Args:
             retry_count: Current retry attempt (0-based)
+            error: The exception that triggered the retry
 
         Returns:
             Delay in seconds
         """
-        return float(2 ** retry_count)
+        retry_after = getattr(error, "retry_after", None)
+        if retry_after is not None:
+            try:
+                return max(0.0, float(retry_after))
+            except (TypeError, ValueError):
+                pass
+
+        return random.uniform(0, min(cls.MAX_RETRY_DELAY, 2 ** retry_count))
 
-    def _sync_to_notion(self, task_id: str, title: Optional[str] = None) -> None:
+    def _sync_to_notion(
+        self, task: TranslationTask, title: Optional[str] = None
+    ) -> None:
         """
         Sync completed translation to Notion.
 
         Args:
-            task_id: Task identifier
+            task: Cache task object
             title: Optional title for Notion page
         """
+        task_id = task.task_id
         try:
-            from config.settings import get_config
             from agent.tools.notion_publisher import NotionPublisher
 
-            config = get_config()
+            config = self._config
 
             # Check Notion configuration
             if not config.notion.api_key:
@@ -869,12 +1192,6 @@ class BackgroundTaskManager:
                 )
                 return
 
-            # Get task data
-            task = self._cache.get_task(task_id)
-            if not task:
-                logger.error(f"Task {task_id}: Notion sync failed - task not found")
-                return
-
             if task.status != TaskStatus.COMPLETED:
                 logger.warning(
                     f"Task {task_id}: Notion sync skipped - task not completed "
@@ -931,13 +1248,18 @@ def get_task_manager() -> BackgroundTaskManager:
     """
     global _task_manager
 
-    if _task_manager is None:
+    # Hot path: one global read, no lock. Reading into a local also means a
+    # concurrent shutdown_task_manager() cannot make this return None.
+    manager = _task_manager
+    if manager is None:
         with _manager_lock:
-            if _task_manager is None:
-                _task_manager = BackgroundTaskManager()
-                _task_manager.start()
+            manager = _task_manager
+            if manager is None:
+                manager = BackgroundTaskManager()
+                manager.start()
+                _task_manager = manager
 
-    return _task_manager
+    return manager
 
 
 def shutdown_task_manager() -> None:
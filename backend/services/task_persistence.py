@@ -3,21 +3,23 @@ Task persistence service for saving/loading tasks to/from disk.
 
 Provides:
 - Periodic snapshots to JSON file
-- Immediate persistence on state changes
+- Debounced persistence on state changes
 - Task recovery on service restart
 - Expired task cleanup
 - Result file management
 """
 
+import gzip
 import json
 import logging
 import os
+import queue
 import threading
 import time
-from dataclasses import asdict
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, BinaryIO, Iterator, Mapping
 
 from backend.services.cache_service import (
     CacheService,
@@ -25,9 +27,74 @@ from backend.services.cache_service import (
     TaskStatus,
     TranslationTask,
 )
+from backend.services.chunking_service import ChunkingService
+from config.settings import get_config
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to stdlib json
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+_O_DIRECTORY = getattr(os, "O_DIRECTORY", None)
+
+# Enum members bound once for per-task loops
+_PENDING = TaskStatus.PENDING
+_IN_PROGRESS = TaskStatus.IN_PROGRESS
+_COMPLETED = TaskStatus.COMPLETED
+_FAILED = TaskStatus.FAILED
+_FINISHED_STATUSES = (_COMPLETED, _FAILED)
+_RESUMABLE_STATUS_VALUES = frozenset((_PENDING.value, _IN_PROGRESS.value))
+_FINISHED_STATUS_VALUES = frozenset((_COMPLETED.value, _FAILED.value))
+
+
+@lru_cache(maxsize=1)
+def _get_chunker() -> ChunkingService:
+    """Chunker for re-splitting recovered tasks; config is fixed per process."""
+    chunking = get_config().translation.chunking
+    return ChunkingService(
+        max_tokens=chunking.max_chunk_tokens,
+        overlap_sentences=chunking.overlap_sentences,
+    )
+
+
+def _task_version_key(task: TranslationTask) -> tuple:
+    """
+    Cheap key that changes whenever a task's serialized form does.
+
+    updated_at alone is not enough: some cache updates set status or
+    error after bumping it.
+    """
+    return (
+        task.updated_at,
+        task.status,
+        task.error,
+        len(task.chunks),
+        len(task.translated_chunks),
+    )
+
+
+def _dumps_snapshot(snapshot: Dict[str, Any]) -> bytes:
+    """
+    Serialize a snapshot to UTF-8 JSON bytes (2-space indent).
+
+    Uses orjson when installed, stdlib json otherwise. Both produce the
+    same on-disk format.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            snapshot, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        )
+    return json.dumps(snapshot, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def _loads_snapshot(data: bytes) -> Dict[str, Any]:
+    """Parse snapshot bytes produced by _dumps_snapshot."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 class TaskPersistenceService:
     """
@@ -35,22 +102,27 @@ class TaskPersistenceService:
 
     Features:
     - Periodic snapshots (every 30 seconds)
-    - Immediate persistence on status changes
+    - Debounced persistence on status changes
     - Recovery of pending/in_progress tasks on startup
     - Cleanup of expired tasks (7+ days old)
     - Separate result files to minimize memory usage
 
     File structure:
     - data/tasks.json: Task metadata (without results)
-    - data/results/{task_id}.txt: Translation results
+    - data/results/{task_id}.txt.gz: Translation results (gzip)
     """
 
     # Configuration
     SNAPSHOT_INTERVAL_SECONDS = 30
+    COALESCE_DELAY_SECONDS = 0.5
     TASK_RETENTION_DAYS = 7
     DATA_DIR = Path("data")
     RESULTS_DIR = Path("data/results")
     TASKS_FILE = Path("data/tasks.json")
+    RESULT_SUFFIX = ".txt.gz"
+    LEGACY_RESULT_SUFFIX = ".txt"
+    RESULT_COMPRESS_LEVEL = 1
+    RESULT_LOCK_STRIPES = 32  # must be a power of two
 
     # JSON schema version
     SCHEMA_VERSION = 1
@@ -76,6 +148,11 @@ class TaskPersistenceService:
             self.RESULTS_DIR = self.DATA_DIR / "results"
             self.TASKS_FILE = self.DATA_DIR / "tasks.json"
 
+        # Plain string paths for the snapshot write path
+        self._tasks_file_str = str(self.TASKS_FILE)
+        self._tmp_file_str = str(self.TASKS_FILE.with_suffix(".tmp"))
+        self._data_dir_str = str(self.DATA_DIR)
+
         # Ensure directories exist
         self._ensure_directories()
 
@@ -83,11 +160,30 @@ class TaskPersistenceService:
         self._snapshot_thread: Optional[threading.Thread] = None
         self._running = False
         self._stop_event = threading.Event()
+        # Set by mark_dirty() to wake the snapshot thread early
+        self._coalesce_event = threading.Event()
         self._last_snapshot: Optional[datetime] = None
 
-        # Lock for file operations
+        # Status changes queued for the snapshot thread, the single writer
+        self._write_queue: queue.SimpleQueue = queue.SimpleQueue()
+
+        # Dirty tracking: skip periodic snapshots when nothing changed
+        self._dirty_version = 0
+        self._last_written_version: Optional[tuple[int, int]] = None
+
+        # Serialized task dicts from the last snapshot, keyed by task_id and
+        # tagged with the task's version key (see _task_version_key)
+        self._ser_cache: Dict[str, tuple[tuple, Dict[str, Any]]] = {}
+
+        # Lock for whole-snapshot operations (tasks.json)
         self._file_lock = threading.Lock()
 
+        # Striped locks for per-task result files; unrelated tasks don't
+        # contend with each other
+        self._result_locks = [
+            threading.Lock() for _ in range(self.RESULT_LOCK_STRIPES)
+        ]
+
     def _ensure_directories(self) -> None:
         """Ensure data directories exist."""
         self.DATA_DIR.mkdir(parents=True, exist_ok=True)
@@ -101,6 +197,7 @@ class TaskPersistenceService:
 
         self._running = True
         self._stop_event.clear()
+        self._coalesce_event.clear()
 
         # Start snapshot thread
         self._snapshot_thread = threading.Thread(
@@ -119,11 +216,13 @@ class TaskPersistenceService:
 
         self._running = False
         self._stop_event.set()
+        self._coalesce_event.set()
 
         if self._snapshot_thread and self._snapshot_thread.is_alive():
             self._snapshot_thread.join(timeout=5.0)
 
-        # Final snapshot
+        # Flush queued result files, then final snapshot
+        self._drain_write_queue()
         self.save_snapshot()
 
         logger.info("TaskPersistenceService stopped")
@@ -132,12 +231,52 @@ class TaskPersistenceService:
         """Periodic snapshot loop."""
         while self._running and not self._stop_event.is_set():
             try:
-                self.save_snapshot()
+                self._drain_write_queue()
+                if self._current_version() != self._last_written_version:
+                    self.save_snapshot()
             except Exception as e:
                 logger.error(f"Snapshot failed: {e}", exc_info=True)
 
-            # Wait for interval or stop event
-            self._stop_event.wait(timeout=self.SNAPSHOT_INTERVAL_SECONDS)
+            # Wait for interval or a change notification; on a change, wait a
+            # little longer so a burst of transitions becomes one write
+            if self._coalesce_event.wait(timeout=self.SNAPSHOT_INTERVAL_SECONDS):
+                self._stop_event.wait(timeout=self.COALESCE_DELAY_SECONDS)
+                self._coalesce_event.clear()
+
+    def mark_dirty(self) -> None:
+        """
+        Flag that task state changed and schedule a coalesced snapshot.
+
+        The snapshot thread writes at most once per COALESCE_DELAY_SECONDS
+        burst instead of once per call.
+        """
+        self._dirty_version += 1
+        self._coalesce_event.set()
+
+    def _drain_write_queue(self) -> None:
+        """
+        Persist queued status changes.
+
+        Repeated changes for the same task collapse to the latest status;
+        completed tasks get their result file written.
+        """
+        latest: Dict[str, TaskStatus] = {}
+        while True:
+            try:
+                task_id, status = self._write_queue.get_nowait()
+            except queue.Empty:
+                break
+            latest[task_id] = status
+
+        for task_id, status in latest.items():
+            if status is _COMPLETED:
+                task = self._cache.get_task(task_id)
+                if task:
+                    self.save_result_to_file(task_id, task.partial_result)
+
+    def _current_version(self) -> tuple[int, int]:
+        """Combined version of the cache contents and local dirty marks."""
+        return (self._cache.version, self._dirty_version)
 
     def save_snapshot(self) -> bool:
         """
@@ -148,6 +287,10 @@ class TaskPersistenceService:
         """
         with self._file_lock:
             try:
+                # Read the version first so changes made while serializing
+                # still trigger the next snapshot
+                version = self._current_version()
+
                 # Get all tasks from cache
                 tasks_data = self._serialize_tasks()
 
@@ -158,14 +301,26 @@ class TaskPersistenceService:
                     "tasks": tasks_data,
                 }
 
-                # Write atomically using temp file
-                temp_file = self.TASKS_FILE.with_suffix(".tmp")
-                with open(temp_file, "w", encoding="utf-8") as f:
-                    json.dump(snapshot, f, ensure_ascii=False, indent=2)
-
-                # Rename to final location (atomic on most systems)
-                temp_file.replace(self.TASKS_FILE)
-
+                # Write atomically using temp file, flushed to disk before
+                # the rename so a crash can't leave a truncated tasks.json
+                data = _dumps_snapshot(snapshot)
+                fd = os.open(
+                    self._tmp_file_str, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644
+                )
+                try:
+                    view = memoryview(data)
+                    while view:
+                        written = os.write(fd, view)
+                        view = view[written:]
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+
+                # Rename to final location, then persist the directory entry
+                os.replace(self._tmp_file_str, self._tasks_file_str)
+                self._fsync_data_dir()
+
+                self._last_written_version = version
                 self._last_snapshot = datetime.now()
                 logger.debug(f"Snapshot saved: {len(tasks_data)} tasks")
 
@@ -175,6 +330,17 @@ class TaskPersistenceService:
                 logger.error(f"Failed to save snapshot: {e}", exc_info=True)
                 return False
 
+    def _fsync_data_dir(self) -> None:
+        """Flush the data directory so the snapshot rename survives a crash."""
+        if _O_DIRECTORY is None:  # Not supported on Windows
+            return
+
+        dir_fd = os.open(self._data_dir_str, os.O_RDONLY | _O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
     def _serialize_tasks(self) -> Dict[str, Any]:
         """
         Serialize all tasks from cache to dict format.
@@ -184,42 +350,71 @@ class TaskPersistenceService:
         Returns:
             Dictionary of task_id -> task_data
         """
+        # The cache snapshot is already a point-in-time copy, so no lock
+        # is needed while building the payload. Called under _file_lock,
+        # which also guards _ser_cache.
+        previous = self._ser_cache
+        ser_cache = {}
         tasks_data = {}
 
-        # Get all tasks from cache (we need to add this method to CacheService)
-        cache_tasks = self._get_all_tasks_from_cache()
-
-        for task_id, task in cache_tasks.items():
-            task_data = {
-                "task_id": task.task_id,
-                "status": task.status.value,
-                "progress": task.progress,
-                "original_content": task.original_content,
-                "total_chunks": len(task.chunks),
-                "completed_chunks": len(task.translated_chunks),
-                "title": task.title,
-                "source_url": task.source_url,
-                "domain": task.domain,
-                "error_message": task.error,
-                "created_at": task.created_at.isoformat(),
-                "updated_at": task.updated_at.isoformat(),
-                "total_input_tokens": task.total_input_tokens,
-                "total_output_tokens": task.total_output_tokens,
-            }
-
-            # Store result file reference if completed
-            if task.status == TaskStatus.COMPLETED:
-                task_data["result_file"] = f"results/{task_id}.txt"
-
+        for task_id, task in self._get_all_tasks_from_cache().items():
+            # Take the key before serializing: a change that races with
+            # the build then leaves a stale key and forces a rebuild
+            key = _task_version_key(task)
+            cached = previous.get(task_id)
+            if cached is not None and cached[0] == key:
+                task_data = cached[1]
+            else:
+                task_data = self._serialize_task(task)
+            ser_cache[task_id] = (key, task_data)
             tasks_data[task_id] = task_data
 
+        # Rebuilt each time, so deleted tasks drop out
+        self._ser_cache = ser_cache
         return tasks_data
 
-    def _get_all_tasks_from_cache(self) -> Dict[str, TranslationTask]:
-        """Get all tasks from cache service."""
-        # Access internal cache dict (we'll add a proper method later)
-        with self._cache._lock:
-            return dict(self._cache._cache)
+    @staticmethod
+    def _serialize_task(task: TranslationTask) -> Dict[str, Any]:
+        """
+        Serialize a single task (without translated_chunks).
+
+        Reads fields by name rather than via dataclasses.asdict(), which
+        would deep-copy the chunk lists.
+        """
+        task_id = task.task_id
+        status = task.status
+        # Inline TranslationTask.progress so each len() is taken once
+        total_chunks = len(task.chunks)
+        completed_chunks = len(task.translated_chunks)
+        progress = (
+            int((completed_chunks / total_chunks) * 100) if total_chunks else 0
+        )
+        task_data = {
+            "task_id": task_id,
+            "status": status.value,
+            "progress": progress,
+            "original_content": task.original_content,
+            "total_chunks": total_chunks,
+            "completed_chunks": completed_chunks,
+            "title": task.title,
+            "source_url": task.source_url,
+            "domain": task.domain,
+            "error_message": task.error,
+            "created_at": task.created_at.isoformat(),
+            "updated_at": task.updated_at.isoformat(),
+            "total_input_tokens": task.total_input_tokens,
+            "total_output_tokens": task.total_output_tokens,
+        }
+
+        # Store result file reference if completed
+        if status is _COMPLETED:
+            task_data["result_file"] = f"results/{task_id}.txt.gz"
+
+        return task_data
+
+    def _get_all_tasks_from_cache(self) -> Mapping[str, TranslationTask]:
+        """Get a point-in-time snapshot of all tasks from cache service."""
+        return self._cache.snapshot()
 
     def load_and_recover(self) -> int:
         """
@@ -228,19 +423,26 @@ class TaskPersistenceService:
         Recovery rules:
         - pending tasks: Keep pending, re-add to queue
         - in_progress tasks: Reset to pending, re-add to queue
-        - completed/failed tasks: Keep as is
+        - completed/failed tasks: Keep as is, unless past the retention
+          period; those are dropped (with their result files) before
+          being deserialized
 
         Returns:
             Number of tasks recovered
         """
         with self._file_lock:
-            if not self.TASKS_FILE.exists():
+            try:
+                with open(self.TASKS_FILE, "rb") as f:
+                    data = f.read()
+            except FileNotFoundError:
                 logger.info("No tasks file found, starting fresh")
                 return 0
+            except OSError as e:
+                logger.error(f"Failed to read tasks file: {e}", exc_info=True)
+                return 0
 
             try:
-                with open(self.TASKS_FILE, "r", encoding="utf-8") as f:
-                    snapshot = json.load(f)
+                snapshot = _loads_snapshot(data)
 
                 # Check version compatibility
                 version = snapshot.get("version", 1)
@@ -251,9 +453,23 @@ class TaskPersistenceService:
 
                 tasks_data = snapshot.get("tasks", {})
                 recovered_count = 0
+                expired_count = 0
                 tasks_to_queue = []
+                cutoff = (
+                    datetime.now() - timedelta(days=self.TASK_RETENTION_DAYS)
+                ).isoformat()
 
                 for task_id, task_data in tasks_data.items():
+                    # Skip expired tasks without re-chunking their content;
+                    # ISO timestamps compare correctly as strings
+                    if (
+                        task_data.get("status") in _FINISHED_STATUS_VALUES
+                        and task_data.get("created_at", "") < cutoff
+                    ):
+                        self.delete_result_file(task_id)
+                        expired_count += 1
+                        continue
+
                     task = self._deserialize_task(task_id, task_data)
                     if not task:
                         continue
@@ -261,9 +477,9 @@ class TaskPersistenceService:
                     original_status = task.status
 
                     # Apply recovery rules
-                    if task.status == TaskStatus.IN_PROGRESS:
+                    if original_status is _IN_PROGRESS:
                         # Reset to pending for re-execution
-                        task.status = TaskStatus.PENDING
+                        task.status = _PENDING
                         task.translated_chunks = []
                         task.current_chunk = 0
                         tasks_to_queue.append(task)
@@ -273,7 +489,7 @@ class TaskPersistenceService:
                             f"{original_status.value} -> pending"
                         )
 
-                    elif task.status == TaskStatus.PENDING:
+                    elif original_status is _PENDING:
                         tasks_to_queue.append(task)
                         recovered_count += 1
                         logger.info(f"Task {task_id} recovered: pending")
@@ -286,8 +502,8 @@ class TaskPersistenceService:
                     self._queue_recovered_tasks(tasks_to_queue)
 
                 logger.info(
-                    f"Recovery complete: {len(tasks_data)} tasks loaded, "
-                    f"{recovered_count} tasks queued"
+                    f"Recovery complete: {len(tasks_data) - expired_count} tasks loaded, "
+                    f"{recovered_count} tasks queued, {expired_count} expired dropped"
                 )
 
                 return recovered_count
@@ -315,31 +531,22 @@ class TaskPersistenceService:
             # Reconstruct chunks list (we only store count)
             original_content = task_data.get("original_content", "")
             total_chunks = task_data.get("total_chunks", 1)
+            status_value = task_data.get("status", "pending")
 
-            # Need to re-chunk the content
-            from backend.services.chunking_service import ChunkingService
-            from config.settings import get_config
-
-            config = get_config()
-            chunking = ChunkingService(
-                max_tokens=config.translation.chunking.max_chunk_tokens,
-                overlap_sentences=config.translation.chunking.overlap_sentences,
-            )
-
-            if chunking.needs_chunking(original_content):
-                chunks = chunking.split_by_semantic(original_content)
+            if status_value in _RESUMABLE_STATUS_VALUES:
+                # Need to re-chunk the content
+                chunking = _get_chunker()
+                if chunking.needs_chunking(original_content):
+                    chunks = chunking.split_by_semantic(original_content)
+                else:
+                    chunks = [original_content]
             else:
-                chunks = [original_content]
+                # Finished tasks never translate again (a retry re-chunks in
+                # the task manager); keep only the count for progress/listing
+                chunks = [""] * total_chunks
 
-            # Load translated chunks from result file if completed
+            # Completed results stay on disk; they are loaded on demand
             translated_chunks = []
-            status_value = task_data.get("status", "pending")
-            if status_value == "completed":
-                result_file = self.RESULTS_DIR / f"{task_id}.txt"
-                if result_file.exists():
-                    # For completed tasks, we have the full result
-                    # but don't need to load it into memory here
-                    pass
 
             task = TranslationTask(
                 task_id=task_id,
@@ -390,18 +597,22 @@ class TaskPersistenceService:
                     source_url=task.source_url,
                     domain=task.domain,
                 )
-                manager._task_queue.put(bg_task)
-
-                # Add to pending set
-                with manager._pending_lock:
-                    manager._pending_tasks.add(task.task_id)
+                manager._enqueue(bg_task)
 
         except Exception as e:
             logger.error(f"Failed to queue recovered tasks: {e}")
 
+    def _result_lock(self, task_id: str) -> threading.Lock:
+        """Get the stripe lock guarding a task's result file."""
+        return self._result_locks[hash(task_id) & (self.RESULT_LOCK_STRIPES - 1)]
+
+    def _result_file(self, task_id: str, suffix: Optional[str] = None) -> Path:
+        """Path of a task's result file (compressed by default)."""
+        return self.RESULTS_DIR / f"{task_id}{suffix or self.RESULT_SUFFIX}"
+
     def save_result_to_file(self, task_id: str, result: str) -> bool:
         """
-        Save translation result to a separate file.
+        Save translation result to a separate gzip-compressed file.
 
         Used to offload results from memory after task completion.
 
@@ -413,9 +624,25 @@ class TaskPersistenceService:
             True if saved successfully
         """
         try:
-            result_file = self.RESULTS_DIR / f"{task_id}.txt"
-            with open(result_file, "w", encoding="utf-8") as f:
-                f.write(result)
+            result_file = self._result_file(task_id)
+            data = gzip.compress(
+                result.encode("utf-8"),
+                compresslevel=self.RESULT_COMPRESS_LEVEL,
+            )
+
+            with self._result_lock(task_id):
+                # Unbuffered write: skips the TextIOWrapper/BufferedWriter layers
+                fd = os.open(result_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                try:
+                    view = memoryview(data)
+                    while view:
+                        written = os.write(fd, view)
+                        view = view[written:]
+                finally:
+                    os.close(fd)
+
+                # Drop an uncompressed copy left by an older version
+                self._result_file(task_id, self.LEGACY_RESULT_SUFFIX).unlink(missing_ok=True)
 
             logger.debug(f"Result saved to file: {result_file}")
             return True
@@ -428,6 +655,8 @@ class TaskPersistenceService:
         """
         Load translation result from file.
 
+        Reads the compressed file, falling back to a legacy plain .txt.
+
         Args:
             task_id: Task identifier
 
@@ -435,20 +664,83 @@ class TaskPersistenceService:
             Result text or None if not found
         """
         try:
-            result_file = self.RESULTS_DIR / f"{task_id}.txt"
-            if not result_file.exists():
-                return None
+            with self._result_lock(task_id):
+                f = self._open_result(task_id)
+                if f is None:
+                    return None
 
-            with open(result_file, "r", encoding="utf-8") as f:
-                return f.read()
+                with f:
+                    return f.read().decode("utf-8")
 
         except Exception as e:
             logger.error(f"Failed to load result for {task_id}: {e}")
             return None
 
+    def _open_result(self, task_id: str) -> Optional[BinaryIO]:
+        """
+        Open a task's result file for binary reading, decompressing if needed.
+
+        Returns:
+            Readable file object or None if no result file exists
+        """
+        try:
+            return gzip.open(self._result_file(task_id), "rb")
+        except FileNotFoundError:
+            pass
+
+        try:
+            return open(self._result_file(task_id, self.LEGACY_RESULT_SUFFIX), "rb")
+        except FileNotFoundError:
+            return None
+
+    def result_path(self, task_id: str) -> Optional[Path]:
+        """
+        Get the path of a task's result file.
+
+        Lets HTTP handlers serve the file directly (e.g. Flask send_file)
+        instead of reading it into memory first. The returned file is
+        gzip-compressed when its suffix is ".gz", plain UTF-8 otherwise.
+
+        Args:
+            task_id: Task identifier
+
+        Returns:
+            Path to the result file or None if not found
+        """
+        for suffix in (self.RESULT_SUFFIX, self.LEGACY_RESULT_SUFFIX):
+            result_file = self._result_file(task_id, suffix)
+            if result_file.is_file():
+                return result_file
+        return None
+
+    def iter_result(
+        self,
+        task_id: str,
+        chunk_size: int = 65536,
+    ) -> Iterator[bytes]:
+        """
+        Stream a task's result in UTF-8 encoded chunks.
+
+        Compressed files are decompressed on the fly.
+
+        Args:
+            task_id: Task identifier
+            chunk_size: Maximum bytes per chunk
+
+        Yields:
+            Decoded result bytes; nothing if the file is missing
+        """
+        f = self._open_result(task_id)
+        if f is None:
+            return
+
+        with f:
+            while chunk := f.read(chunk_size):
+                yield chunk
+
     def delete_result_file(self, task_id: str) -> bool:
         """
-        Delete a task's result file.
+        Delete a task's result file (compressed and legacy).
 
         Args:
             task_id: Task identifier
@@ -457,9 +749,9 @@ class TaskPersistenceService:
             True if deleted successfully or not exists
         """
         try:
-            result_file = self.RESULTS_DIR / f"{task_id}.txt"
-            if result_file.exists():
-                result_file.unlink()
+            with self._result_lock(task_id):
+                for suffix in (self.RESULT_SUFFIX, self.LEGACY_RESULT_SUFFIX):
+                    self._result_file(task_id, suffix).unlink(missing_ok=True)
             return True
         except Exception as e:
             logger.error(f"Failed to delete result file for {task_id}: {e}")
@@ -477,26 +769,24 @@ class TaskPersistenceService:
         cutoff = datetime.now() - timedelta(days=self.TASK_RETENTION_DAYS)
         removed_count = 0
 
-        with self._file_lock:
-            tasks_to_remove = []
-
-            # Find expired tasks in cache
-            with self._cache._lock:
-                for task_id, task in list(self._cache._cache.items()):
-                    if task.status in (TaskStatus.COMPLETED, TaskStatus.FAILED):
-                        if task.created_at < cutoff:
-                            tasks_to_remove.append(task_id)
+        # Scan a point-in-time copy so neither the cache lock nor the
+        # snapshot file lock is held while deleting
+        tasks_to_remove = [
+            task_id
+            for task_id, task in self._get_all_tasks_from_cache().items()
+            if task.status in _FINISHED_STATUSES and task.created_at < cutoff
+        ]
 
-            # Remove tasks
-            for task_id in tasks_to_remove:
-                # Delete from cache
-                self._cache.delete_task(task_id)
+        # Remove tasks
+        for task_id in tasks_to_remove:
+            # Delete from cache
+            self._cache.delete_task(task_id)
 
-                # Delete result file
-                self.delete_result_file(task_id)
+            # Delete result file
+            self.delete_result_file(task_id)
 
-                removed_count += 1
-                logger.info(f"Expired task removed: {task_id}")
+            removed_count += 1
+            logger.info(f"Expired task removed: {task_id}")
 
         if removed_count > 0:
             self.save_snapshot()
@@ -513,25 +803,27 @@ class TaskPersistenceService:
         """
         Called when a task's status changes.
 
-        Triggers immediate persistence for important state changes.
+        Only enqueues the change and returns; the snapshot thread writes
+        result files and a coalesced snapshot, so callers never wait on
+        disk I/O.
 
         Args:
             task_id: Task identifier
             old_status: Previous status
             new_status: New status
         """
-        # Save result to file when completed
-        if new_status == TaskStatus.COMPLETED:
-            task = self._cache.get_task(task_id)
-            if task:
-                self.save_result_to_file(task_id, task.partial_result)
+        self._write_queue.put((task_id, new_status))
 
-        # Save snapshot immediately
-        self.save_snapshot()
+        if self._running:
+            self.mark_dirty()
+        else:
+            # No snapshot thread to hand off to; write synchronously
+            self._drain_write_queue()
+            self.save_snapshot()
 
         logger.info(
             f"Task {task_id} status changed: "
-            f"{old_status.value} -> {new_status.value}, snapshot saved"
+            f"{old_status.value} -> {new_status.value}, snapshot scheduled"
         )
 
 
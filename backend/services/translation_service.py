@@ -8,18 +8,55 @@ Orchestrates the translation process:
 - SSE event generation for streaming
 """
 
+import asyncio
 import json
-import uuid
+import re
+import secrets
+import threading
 from dataclasses import dataclass
-from typing import AsyncGenerator, Optional
+from typing import AsyncGenerator, List, Optional
 
 from config.settings import AppConfig, get_config
 from agent.sdk_translator_agent import SDKTranslatorAgent, SDKStreamChunk
 from backend.services.chunking_service import ChunkingService
 from backend.services.cache_service import CacheService, get_cache_service, TaskStatus
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to stdlib json
+    orjson = None
 
-@dataclass
+# C0 control characters other than tab/newline/carriage return; they carry
+# no meaning for translation and are replaced once on the whole input
+_PRE_NORMALIZE_RE = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f]+')
+
+
+def _json_bytes(obj) -> bytes:
+    """
+    Serialize an SSE payload to UTF-8 JSON bytes.
+
+    Uses orjson when installed (compact output, no re-encoding), stdlib
+    json otherwise or for values orjson rejects (e.g. lone surrogates).
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            pass
+    try:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+    except UnicodeEncodeError:
+        # Lone surrogates can't be UTF-8 encoded; emit them as \u escapes
+        return json.dumps(obj).encode("ascii")
+
+
+# Streamed text deltas are by far the most frequent event; same payload as
+# SSEEvent(event="text", data={"text": ..., "is_complete": False}).to_bytes()
+_TEXT_FRAME_PREFIX = b'event: text\ndata: {"text": '
+_TEXT_FRAME_SUFFIX = b', "is_complete": false}\n\n'
+
+
+@dataclass(slots=True)
 class SSEEvent:
     """Server-Sent Event data structure."""
 
@@ -42,6 +79,98 @@ class SSEEvent:
         lines.append("")  # Empty line to end the event
         return "\n".join(lines) + "\n"
 
+    def to_bytes(self) -> bytes:
+        """
+        Convert to an SSE frame encoded as UTF-8.
+
+        Streaming generators yield bytes so the HTTP layer can write them
+        as-is instead of encoding every frame again.
+        """
+        parts = []
+        if self.id:
+            parts.append(f"id: {self.id}\n".encode("utf-8"))
+        if self.event:
+            parts.append(f"event: {self.event}\n".encode("utf-8"))
+        if self.retry:
+            parts.append(f"retry: {self.retry}\n".encode("utf-8"))
+        if self.data is not None:
+            parts.append(b"data: " + _json_bytes(self.data) + b"\n")
+        parts.append(b"\n")  # Empty line to end the event
+        return b"".join(parts)
+
+    @staticmethod
+    def text_frame(text: str) -> bytes:
+        """
+        Build a streamed "text" event without constructing an SSEEvent.
+
+        Args:
+            text: Translated text delta.
+
+        Returns:
+            SSE frame as UTF-8 bytes.
+        """
+        return b"".join((
+            _TEXT_FRAME_PREFIX,
+            _json_bytes(text),
+            _TEXT_FRAME_SUFFIX,
+        ))
+
+
+# Frequent fixed-shape events are formatted directly from these templates;
+# output matches SSEEvent(...).to_string() for the same data. Only safe
+# values are interpolated (ints, floats, hex task ids, fixed status strings).
+_START_TMPL = 'event: start\ndata: {"task_id": "%s", "status": "%s"}\n\n'
+_CHUNKING_TMPL = 'event: chunking\ndata: {"total_chunks": %d, "task_id": "%s"}\n\n'
+_CHUNK_START_TMPL = (
+    'event: chunk_start\ndata: {"chunk_number": %d, "total_chunks": %d, '
+    '"progress": %d}\n\n'
+)
+_CHUNK_COMPLETE_TMPL = (
+    'event: chunk_complete\ndata: {"chunk_number": %d, "total_chunks": %d, '
+    '"progress": %d}\n\n'
+)
+_COMPLETE_TMPL = (
+    'event: complete\ndata: {"text": "", "is_complete": true, '
+    '"task_id": "%s", "input_tokens": %d, "output_tokens": %d, '
+    '"cost_usd": %r}\n\n'
+)
+
+
+def sse_start(task_id: str, status: str) -> bytes:
+    """Build the "start" event."""
+    return (_START_TMPL % (task_id, status)).encode("utf-8")
+
+
+def sse_chunking(total_chunks: int, task_id: str) -> bytes:
+    """Build the "chunking" event."""
+    return (_CHUNKING_TMPL % (total_chunks, task_id)).encode("utf-8")
+
+
+def sse_chunk_start(chunk_number: int, total_chunks: int, progress: int) -> bytes:
+    """Build a "chunk_start" event."""
+    return (
+        _CHUNK_START_TMPL % (chunk_number, total_chunks, progress)
+    ).encode("utf-8")
+
+
+def sse_chunk_complete(chunk_number: int, total_chunks: int, progress: int) -> bytes:
+    """Build a "chunk_complete" event."""
+    return (
+        _CHUNK_COMPLETE_TMPL % (chunk_number, total_chunks, progress)
+    ).encode("utf-8")
+
+
+def sse_complete(
+    task_id: str,
+    input_tokens: int,
+    output_tokens: int,
+    cost_usd: float,
+) -> bytes:
+    """Build the final "complete" event."""
+    return (
+        _COMPLETE_TMPL % (task_id, input_tokens, output_tokens, cost_usd)
+    ).encode("utf-8")
+
 
 class TranslationService:
     """
@@ -81,7 +210,7 @@ class TranslationService:
         title: Optional[str] = None,
         domain: str = "tech",
         sync_to_notion: bool = False,
-    ) -> AsyncGenerator[str, None]:
+    ) -> AsyncGenerator[bytes, None]:
         """
         Generate SSE format event stream for translation.
 
@@ -93,15 +222,12 @@ class TranslationService:
             sync_to_notion: Whether to sync to Notion after translation.
 
         Yields:
-            SSE formatted strings.
+            SSE frames as UTF-8 bytes.
         """
-        task_id = str(uuid.uuid4())
+        task_id = secrets.token_hex(16)
 
         # Send initial event with task ID
-        yield SSEEvent(
-            event="start",
-            data={"task_id": task_id, "status": "started"}
-        ).to_string()
+        yield sse_start(task_id, "started")
 
         # Handle URL fetching first
         if url and not content:
@@ -113,7 +239,7 @@ class TranslationService:
                         "text": f"Error fetching URL: {fetch_result.error}",
                         "is_complete": True
                     }
-                ).to_string()
+                ).to_bytes()
                 return
             content = fetch_result.content
             if not title:
@@ -123,18 +249,20 @@ class TranslationService:
             yield SSEEvent(
                 event="fetch_complete",
                 data={"title": title, "content_length": len(content)}
-            ).to_string()
+            ).to_bytes()
 
         if not content:
             yield SSEEvent(
                 event="error",
                 data={"text": "Error: No content to translate", "is_complete": True}
-            ).to_string()
+            ).to_bytes()
             return
 
+        content = _PRE_NORMALIZE_RE.sub(" ", content)
+
         # Check if chunking is needed
         if self.chunking.needs_chunking(content):
-            async for sse_string in self._stream_chunked_translation_sse(
+            async for sse_frame in self._stream_chunked_translation_sse(
                 content=content,
                 title=title,
                 domain=domain,
@@ -142,9 +270,9 @@ class TranslationService:
                 source_url=url,
                 sync_to_notion=sync_to_notion,
             ):
-                yield sse_string
+                yield sse_frame
         else:
-            async for sse_string in self._stream_simple_translation_sse(
+            async for sse_frame in self._stream_simple_translation_sse(
                 content=content,
                 title=title,
                 domain=domain,
@@ -152,7 +280,7 @@ class TranslationService:
                 source_url=url,
                 sync_to_notion=sync_to_notion,
             ):
-                yield sse_string
+                yield sse_frame
 
     async def _stream_simple_translation_sse(
         self,
@@ -162,7 +290,7 @@ class TranslationService:
         task_id: str,
         source_url: Optional[str] = None,
         sync_to_notion: bool = False,
-    ) -> AsyncGenerator[str, None]:
+    ) -> AsyncGenerator[bytes, None]:
         """Stream simple (non-chunked) translation as SSE."""
         total_input_tokens = 0
         total_output_tokens = 0
@@ -179,6 +307,7 @@ class TranslationService:
                 domain=domain,
             )
 
+        # Deltas are only kept when the cache needs the full translation
         translated_result = []
 
         async for chunk in self.agent.translate_stream(
@@ -188,11 +317,9 @@ class TranslationService:
             task_id=task_id,
         ):
             if not chunk.is_complete:
-                translated_result.append(chunk.text)
-                yield SSEEvent(
-                    event="text",
-                    data={"text": chunk.text, "is_complete": False}
-                ).to_string()
+                if sync_to_notion:
+                    translated_result.append(chunk.text)
+                yield SSEEvent.text_frame(chunk.text)
             else:
                 total_input_tokens = chunk.input_tokens
                 total_output_tokens = chunk.output_tokens
@@ -201,6 +328,9 @@ class TranslationService:
         # Update cache with translated result
         if sync_to_notion:
             full_translation = "".join(translated_result)
+            # Drop the pieces now; the generator frame stays alive for the
+            # whole Notion publish
+            translated_result.clear()
             self.cache.update_progress(
                 task_id=task_id,
                 translated_chunk=full_translation,
@@ -209,26 +339,11 @@ class TranslationService:
             )
             self.cache.mark_completed(task_id)
 
-        # Send completion event
-        yield SSEEvent(
-            event="complete",
-            data={
-                "text": "",
-                "is_complete": True,
-                "task_id": task_id,
-                "input_tokens": total_input_tokens,
-                "output_tokens": total_output_tokens,
-                "cost_usd": total_cost,
-            }
-        ).to_string()
-
-        # Sync to Notion if requested
-        if sync_to_notion:
-            result = self.publish_to_notion(task_id, title)
-            yield SSEEvent(
-                event="notion_synced",
-                data=result
-            ).to_string()
+        async for sse_frame in self._emit_completion(
+            task_id, title, total_input_tokens, total_output_tokens,
+            total_cost, sync_to_notion,
+        ):
+            yield sse_frame
 
     async def _stream_chunked_translation_sse(
         self,
@@ -238,14 +353,16 @@ class TranslationService:
         task_id: str,
         source_url: Optional[str] = None,
         sync_to_notion: bool = False,
-    ) -> AsyncGenerator[str, None]:
+    ) -> AsyncGenerator[bytes, None]:
         """Stream chunked translation as SSE."""
         # Split content
         chunks = self.chunking.split_by_semantic(content)
         total_chunks = len(chunks)
 
-        # Create task in cache
-        self.cache.create_task(
+        # Create task in cache under the task_id announced in the start
+        # event, so progress updates and Notion sync can find it
+        self.cache.create_task_with_id(
+            task_id=task_id,
             original_content=content,
             chunks=chunks,
             title=title,
@@ -254,98 +371,138 @@ class TranslationService:
         )
 
         # Send chunking info
-        yield SSEEvent(
-            event="chunking",
-            data={"total_chunks": total_chunks, "task_id": task_id}
-        ).to_string()
+        yield sse_chunking(total_chunks, task_id)
 
-        context = ""
         total_input_tokens = 0
         total_output_tokens = 0
         total_cost = 0.0
 
-        for i, chunk_text in enumerate(chunks):
-            # Send chunk progress
-            yield SSEEvent(
-                event="chunk_start",
-                data={
-                    "chunk_number": i + 1,
-                    "total_chunks": total_chunks,
-                    "progress": int((i / total_chunks) * 100),
-                }
-            ).to_string()
-
-            chunk_result = []
-
-            async for stream_chunk in self.agent.translate_chunk_stream(
-                content=chunk_text,
-                chunk_number=i + 1,
-                total_chunks=total_chunks,
-                context=context,
-                domain=domain,
-            ):
-                if not stream_chunk.is_complete:
-                    chunk_result.append(stream_chunk.text)
-                    yield SSEEvent(
-                        event="text",
-                        data={"text": stream_chunk.text, "is_complete": False}
-                    ).to_string()
-                else:
-                    total_input_tokens += stream_chunk.input_tokens
-                    total_output_tokens += stream_chunk.output_tokens
-                    total_cost += stream_chunk.cost_usd
-
-            # Update context for next chunk
-            full_chunk = "".join(chunk_result)
-            context = full_chunk[-500:] if len(full_chunk) > 500 else full_chunk
-
-            # Update cache
-            self.cache.update_progress(
-                task_id=task_id,
-                translated_chunk=full_chunk,
-                input_tokens=total_input_tokens,
-                output_tokens=total_output_tokens,
-            )
-
-            # Send chunk complete
-            yield SSEEvent(
-                event="chunk_complete",
-                data={
-                    "chunk_number": i + 1,
-                    "total_chunks": total_chunks,
-                    "progress": int(((i + 1) / total_chunks) * 100),
-                }
-            ).to_string()
+        # Up to chunk_concurrency chunks are translated ahead of the one
+        # being streamed; their deltas are buffered and emitted in order.
+        # A chunk gets the previous chunk's tail as context only if that
+        # chunk had finished when it started - always the case with the
+        # default concurrency of 1.
+        concurrency = max(1, self.config.agent.chunk_concurrency)
+        contexts = [""] * total_chunks
+        queues: List[asyncio.Queue] = []
+        producers: List[asyncio.Task] = []
+
+        async def produce(index: int, context: str, queue: asyncio.Queue) -> None:
+            try:
+                async for stream_chunk in self.agent.translate_chunk_stream(
+                    content=chunks[index],
+                    chunk_number=index + 1,
+                    total_chunks=total_chunks,
+                    context=context,
+                    domain=domain,
+                ):
+                    queue.put_nowait(stream_chunk)
+            except Exception as e:
+                queue.put_nowait(e)
+            finally:
+                queue.put_nowait(None)
+
+        def start_producers(until: int) -> None:
+            for index in range(len(producers), min(until, total_chunks)):
+                queue: asyncio.Queue = asyncio.Queue()
+                queues.append(queue)
+                context = contexts[index - 1] if index else ""
+                producers.append(
+                    asyncio.create_task(produce(index, context, queue))
+                )
+
+        # Progress events are only sent when the integer percentage moves,
+        # which only thins them out for documents with over 100 chunks
+        last_start_pct = -1
+        last_complete_pct = -1
+
+        try:
+            for i in range(total_chunks):
+                start_producers(i + concurrency)
+
+                # Send chunk progress
+                pct = int((i / total_chunks) * 100)
+                if pct != last_start_pct:
+                    last_start_pct = pct
+                    yield sse_chunk_start(i + 1, total_chunks, pct)
+
+                chunk_result = []
+                chunk_input_tokens = 0
+                chunk_output_tokens = 0
+                queue = queues[i]
+
+                while (stream_chunk := await queue.get()) is not None:
+                    if isinstance(stream_chunk, Exception):
+                        raise stream_chunk
+                    if not stream_chunk.is_complete:
+                        chunk_result.append(stream_chunk.text)
+                        yield SSEEvent.text_frame(stream_chunk.text)
+                    else:
+                        chunk_input_tokens += stream_chunk.input_tokens
+                        chunk_output_tokens += stream_chunk.output_tokens
+                        total_cost += stream_chunk.cost_usd
+                total_input_tokens += chunk_input_tokens
+                total_output_tokens += chunk_output_tokens
+
+                # Update context for next chunk; the joined chunk is needed
+                # for the cache anyway, so the tail is a single bounded slice
+                full_chunk = "".join(chunk_result)
+                contexts[i] = full_chunk[-500:]
+
+                # Update cache (token counts are per chunk; the cache sums them)
+                self.cache.update_progress(
+                    task_id=task_id,
+                    translated_chunk=full_chunk,
+                    input_tokens=chunk_input_tokens,
+                    output_tokens=chunk_output_tokens,
+                )
+
+                # Send chunk complete
+                pct = int(((i + 1) / total_chunks) * 100)
+                if pct != last_complete_pct:
+                    last_complete_pct = pct
+                    yield sse_chunk_complete(i + 1, total_chunks, pct)
+        finally:
+            # Client disconnects or failures must not leave translations
+            # running in the background
+            for producer in producers:
+                producer.cancel()
 
         # Mark complete in cache
         self.cache.mark_completed(task_id)
 
-        # Send final completion event
-        yield SSEEvent(
-            event="complete",
-            data={
-                "text": "",
-                "is_complete": True,
-                "task_id": task_id,
-                "input_tokens": total_input_tokens,
-                "output_tokens": total_output_tokens,
-                "cost_usd": total_cost,
-            }
-        ).to_string()
+        async for sse_frame in self._emit_completion(
+            task_id, title, total_input_tokens, total_output_tokens,
+            total_cost, sync_to_notion,
+        ):
+            yield sse_frame
 
-        # Sync to Notion if requested
+    async def _emit_completion(
+        self,
+        task_id: str,
+        title: Optional[str],
+        input_tokens: int,
+        output_tokens: int,
+        cost_usd: float,
+        sync_to_notion: bool,
+    ) -> AsyncGenerator[bytes, None]:
+        """Send the "complete" event, then sync to Notion if requested."""
+        yield sse_complete(task_id, input_tokens, output_tokens, cost_usd)
+
+        # Sync to Notion if requested (blocking HTTP; run it off the
+        # event loop shared by all streaming requests)
         if sync_to_notion:
-            result = self.publish_to_notion(task_id, title)
+            result = await asyncio.to_thread(self.publish_to_notion, task_id, title)
             yield SSEEvent(
                 event="notion_synced",
                 data=result
-            ).to_string()
+            ).to_bytes()
 
     async def translate_with_agent_sse(
         self,
         prompt: str,
         domain: str = "tech",
-    ) -> AsyncGenerator[str, None]:
+    ) -> AsyncGenerator[bytes, None]:
         """
         Translate using agentic mode with MCP tools.
 
@@ -356,14 +513,11 @@ class TranslationService:
             domain: Translation domain.
 
         Yields:
-            SSE formatted strings.
+            SSE frames as UTF-8 bytes.
         """
-        task_id = str(uuid.uuid4())
+        task_id = secrets.token_hex(16)
 
-        yield SSEEvent(
-            event="start",
-            data={"task_id": task_id, "status": "agent_mode"}
-        ).to_string()
+        yield sse_start(task_id, "agent_mode")
 
         total_input_tokens = 0
         total_output_tokens = 0
@@ -374,26 +528,15 @@ class TranslationService:
             domain=domain,
         ):
             if not chunk.is_complete:
-                yield SSEEvent(
-                    event="text",
-                    data={"text": chunk.text, "is_complete": False}
-                ).to_string()
+                yield SSEEvent.text_frame(chunk.text)
             else:
                 total_input_tokens = chunk.input_tokens
                 total_output_tokens = chunk.output_tokens
                 total_cost = chunk.cost_usd
 
-        yield SSEEvent(
-            event="complete",
-            data={
-                "text": "",
-                "is_complete": True,
-                "task_id": task_id,
-                "input_tokens": total_input_tokens,
-                "output_tokens": total_output_tokens,
-                "cost_usd": total_cost,
-            }
-        ).to_string()
+        yield sse_complete(
+            task_id, total_input_tokens, total_output_tokens, total_cost
+        )
 
     def get_task_progress(self, task_id: str) -> dict:
         """
@@ -444,7 +587,6 @@ class TranslationService:
             }
 
         # 检查任务是否完成
-        from backend.services.cache_service import TaskStatus
         if task.status != TaskStatus.COMPLETED:
             return {
                 "success": False,
@@ -485,6 +627,7 @@ class TranslationService:
 
 # Singleton instance
 _service: Optional[TranslationService] = None
+_service_lock = threading.Lock()
 
 
 def get_translation_service(config: Optional[AppConfig] = None) -> TranslationService:
@@ -498,9 +641,18 @@ def get_translation_service(config: Optional[AppConfig] = None) -> TranslationSe
         TranslationService singleton instance.
     """
     global _service
-    if _service is None:
-        _service = TranslationService(config)
-    return _service
+
+    # Double-checked: concurrent first requests must not each build an
+    # agent and cache; after that this is a lock-free read
+    service = _service
+    if service is None:
+        with _service_lock:
+            service = _service
+            if service is None:
+                service = TranslationService(config)
+                _service = service
+
+    return service
 
 
 # Aliases for backward compatibility
@@ -8,15 +8,14 @@ Supports:
 """
 
 import os
+import threading
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional
 
-import yaml
-from dotenv import load_dotenv
 
-
-@dataclass
+@dataclass(slots=True)
 class DomainConfig:
     """Configuration for a translation domain."""
 
@@ -24,7 +23,7 @@ class DomainConfig:
     prompt_modifier: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ChunkingConfig:
     """Configuration for text chunking/splitting."""
 
@@ -33,7 +32,7 @@ class ChunkingConfig:
     overlap_sentences: int = 2
 
 
-@dataclass
+@dataclass(slots=True)
 class RetryConfig:
     """Configuration for retry behavior."""
 
@@ -43,7 +42,7 @@ class RetryConfig:
     initial_delay_ms: int = 1000
 
 
-@dataclass
+@dataclass(slots=True)
 class TranslationConfig:
     """Configuration for translation settings."""
 
@@ -54,7 +53,7 @@ class TranslationConfig:
     retry: RetryConfig = field(default_factory=RetryConfig)
 
 
-@dataclass
+@dataclass(slots=True)
 class CacheConfig:
     """Configuration for caching (checkpoint/resume)."""
 
@@ -63,7 +62,7 @@ class CacheConfig:
     max_entries: int = 100
 
 
-@dataclass
+@dataclass(slots=True)
 class NotionMetadataConfig:
     """Configuration for Notion page metadata."""
 
@@ -73,7 +72,7 @@ class NotionMetadataConfig:
     include_cost: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class NotionConfig:
     """Configuration for Notion integration."""
 
@@ -82,14 +81,14 @@ class NotionConfig:
     metadata: NotionMetadataConfig = field(default_factory=NotionMetadataConfig)
 
 
-@dataclass
+@dataclass(slots=True)
 class AuthConfig:
     """Configuration for authentication."""
 
     access_keys: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentConfig:
     """Configuration for the Claude Agent."""
 
@@ -98,6 +97,8 @@ class AgentConfig:
     timeout: int = 300
     base_url: str = "https://api.anthropic.com"  # Anthropic API base URL
     use_sdk: bool = True  # SDK mode switch (True = use claude-agent-sdk)
+    worker_count: int = field(default_factory=lambda: min(8, os.cpu_count() or 1))  # Background task workers
+    chunk_concurrency: int = 1  # Chunks of one task translated concurrently
     sdk_options: dict = field(default_factory=lambda: {
         "max_tokens": 8192,
         "temperature": 0.7,
@@ -105,7 +106,7 @@ class AgentConfig:
     })
 
 
-@dataclass
+@dataclass(slots=True)
 class ServerConfig:
     """Configuration for the Flask server."""
 
@@ -114,7 +115,7 @@ class ServerConfig:
     debug: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class AppConfig:
     """Main application configuration."""
 
@@ -250,6 +251,12 @@ def _parse_agent_config(data: dict) -> AgentConfig:
         timeout=_get_env_int("AGENT_TIMEOUT", data.get("timeout", 300)),
         base_url=_get_env("ANTHROPIC_BASE_URL", data.get("base_url", "https://api.anthropic.com")),
         use_sdk=_get_env_bool("USE_SDK", data.get("use_sdk", True)),
+        worker_count=_get_env_int(
+            "WORKER_COUNT", data.get("worker_count", min(8, os.cpu_count() or 1))
+        ),
+        chunk_concurrency=_get_env_int(
+            "CHUNK_CONCURRENCY", data.get("chunk_concurrency", 1)
+        ),
         sdk_options=data.get("sdk_options", {
             "max_tokens": 8192,
             "temperature": 0.7,
@@ -274,6 +281,11 @@ def load_config(
     """
     Load application configuration from YAML file and environment variables.
 
+    Parsed results are cached by file path and modification time, so
+    repeated calls (app factory, CLI, singleton) only re-parse when a file
+    changed. Callers therefore share the returned instance; use
+    reload_config() to force a fresh parse (e.g. after changing env vars).
+
     Args:
         config_path: Path to the YAML configuration file.
                     Defaults to config/config.yaml relative to project root.
@@ -289,19 +301,59 @@ def load_config(
     # Determine project root
     project_root = Path(__file__).parent.parent
 
-    # Load environment variables
     if env_file is None:
         env_file = str(project_root / ".env")
-    if Path(env_file).exists():
-        load_dotenv(env_file)
-
-    # Determine config file path
     if config_path is None:
         config_path = str(project_root / "config" / "config.yaml")
 
+    return _load_config_cached(
+        config_path,
+        env_file,
+        _get_mtime(config_path),
+        _get_mtime(env_file),
+    )
+
+
+def _get_mtime(path: str) -> Optional[int]:
+    """Get a file's modification time in ns, or None if it doesn't exist."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+@lru_cache(maxsize=4)
+def _load_config_cached(
+    config_path: str,
+    env_file: str,
+    config_mtime: Optional[int],
+    env_mtime: Optional[int],
+) -> AppConfig:
+    """
+    Parse configuration; cached on paths and mtimes by load_config().
+
+    Args:
+        config_path: Path to the YAML configuration file.
+        env_file: Path to .env file.
+        config_mtime: Modification time of config_path (cache key only).
+        env_mtime: Modification time of env_file (cache key only).
+
+    Returns:
+        AppConfig: The parsed configuration.
+    """
+    # yaml/dotenv are only imported once a file actually has to be parsed,
+    # keeping them out of module import time
+    # Load environment variables
+    if env_mtime is not None:
+        from dotenv import load_dotenv
+
+        load_dotenv(env_file)
+
     # Load YAML configuration
     config_data = {}
-    if Path(config_path).exists():
+    if config_mtime is not None:
+        import yaml
+
         with open(config_path, "r", encoding="utf-8") as f:
             config_data = yaml.safe_load(f) or {}
     else:
@@ -352,6 +404,7 @@ def validate_config(config: AppConfig) -> List[str]:
 
 # Singleton config instance
 _config: Optional[AppConfig] = None
+_config_lock = threading.Lock()
 
 
 def get_config() -> AppConfig:
@@ -364,9 +417,17 @@ def get_config() -> AppConfig:
         AppConfig: The application configuration.
     """
     global _config
-    if _config is None:
-        _config = load_config()
-    return _config
+
+    # Hot path: one global read, no lock
+    config = _config
+    if config is None:
+        with _config_lock:
+            config = _config
+            if config is None:
+                config = load_config()
+                _config = config
+
+    return config
 
 
 def reload_config() -> AppConfig:
@@ -377,5 +438,7 @@ def reload_config() -> AppConfig:
         AppConfig: The newly loaded configuration.
     """
     global _config
-    _config = load_config()
-    return _config
+    with _config_lock:
+        _load_config_cached.cache_clear()
+        _config = load_config()
+        return _config
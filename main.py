@@ -21,22 +21,86 @@ Environment Variables:
 import argparse
 import os
 import sys
-from pathlib import Path
 
-# Add project root to path
-project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
+# Add project root to path (once; re-imports leave sys.path alone)
+project_root = os.path.dirname(os.path.abspath(__file__))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
-from dotenv import load_dotenv
+
+# Startup banner; filled in with str.format_map by _print_banner()
+_BANNER_TMPL = """
+╔═══════════════════════════════════════════════════════════╗
+║          Translation Agent System v1.0.0                  ║
+╠═══════════════════════════════════════════════════════════╣
+║  Server:  http://{host}:{port:<5}                            ║
+║  Model:   {model:<42} ║
+║  Debug:   {debug:<42} ║
+╠═══════════════════════════════════════════════════════════╣
+║  Endpoints:                                               ║
+║    GET  /api/health          - Health check               ║
+║    POST /api/translate       - Sync translation           ║
+║    POST /api/translate/stream - Stream translation        ║
+║    GET  /api/translate/resume/<id> - Resume/progress      ║
+║    POST /api/notion/sync     - Sync to Notion             ║
+╚═══════════════════════════════════════════════════════════╝
+    """
+
+
+def _print_banner(host: str, port: int, model: str, debug: bool) -> None:
+    """Print the startup banner (serve path only)."""
+    sys.stdout.write(_BANNER_TMPL.format_map({
+        "host": host,
+        "port": port,
+        "model": model,
+        "debug": str(debug),
+    }) + "\n")
+    # stdout is block-buffered under Docker/systemd; show the banner before
+    # the server starts logging
+    sys.stdout.flush()
+
+
+def _serve(args, config) -> None:
+    """
+    Create the Flask app and run the server (never reached by --check).
+
+    Args:
+        args: Parsed command line arguments.
+        config: Loaded and validated AppConfig.
+    """
+    # Flask, the SDK and the Notion client are only imported from here
+    from backend.app import create_app
+
+    app = create_app(config)
+
+    # Determine host and port
+    host = args.host or config.server.host
+    port = args.port or config.server.port
+    debug = args.debug or config.server.debug
+
+    _print_banner(host, port, config.agent.model, debug)
+
+    # Run the server
+    if debug:
+        # Development: reloader and interactive debugger via app.run()
+        app.run(
+            host=host,
+            port=port,
+            debug=debug,
+            threaded=True,
+        )
+    else:
+        # Same threaded werkzeug server app.run() would start, without its
+        # reloader/debugger setup and Flask's extra .env/.flaskenv loading
+        from werkzeug.serving import make_server
+
+        server = make_server(host, port, app, threaded=True)
+        server.log_startup()
+        server.serve_forever()
 
 
 def main():
     """Main entry point."""
-    # Load environment variables from .env file
-    env_file = project_root / '.env'
-    if env_file.exists():
-        load_dotenv(env_file)
-
     # Parse command line arguments
     parser = argparse.ArgumentParser(
         description='Translation Agent System',
@@ -67,7 +131,8 @@ def main():
 
     args = parser.parse_args()
 
-    # Load configuration
+    # Load configuration (this also loads the project's .env file; config and
+    # the Flask app are imported only here so --help stays cheap)
     from config.settings import load_config, validate_config
 
     try:
@@ -85,10 +150,11 @@ def main():
                 print(f"  - {error}", file=sys.stderr)
             sys.exit(1)
         else:
+            server = config.server
             print("Configuration is valid!")
             print(f"  Model: {config.agent.model}")
-            print(f"  Server: {config.server.host}:{config.server.port}")
-            print(f"  Domains: {', '.join(config.translation.domains.keys())}")
+            print(f"  Server: {server.host}:{server.port}")
+            print(f"  Domains: {', '.join(config.translation.domains)}")
             print(f"  Notion: {'Configured' if config.notion.api_key else 'Not configured'}")
             sys.exit(0)
 
@@ -102,39 +168,7 @@ def main():
         sys.exit(1)
 
     # Create and run the application
-    from backend.app import create_app
-
-    app = create_app(config)
-
-    # Determine host and port
-    host = args.host or config.server.host
-    port = args.port or config.server.port
-    debug = args.debug or config.server.debug
-
-    print(f"""
-╔═══════════════════════════════════════════════════════════╗
-║          Translation Agent System v1.0.0                  ║
-╠═══════════════════════════════════════════════════════════╣
-║  Server:  http://{host}:{port:<5}                            ║
-║  Model:   {config.agent.model:<42} ║
-║  Debug:   {str(debug):<42} ║
-╠═══════════════════════════════════════════════════════════╣
-║  Endpoints:                                               ║
-║    GET  /api/health          - Health check               ║
-║    POST /api/translate       - Sync translation           ║
-║    POST /api/translate/stream - Stream translation        ║
-║    GET  /api/translate/resume/<id> - Resume/progress      ║
-║    POST /api/notion/sync     - Sync to Notion             ║
-╚═══════════════════════════════════════════════════════════╝
-    """)
-
-    # Run the server
-    app.run(
-        host=host,
-        port=port,
-        debug=debug,
-        threaded=True,
-    )
+    _serve(args, config)
 
 
 if __name__ == '__main__':